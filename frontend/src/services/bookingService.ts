@@ -51,8 +51,13 @@ export interface BookingUpdate {
   notes?: string;
 }
 
+// Matches the booking service's "Cache-Control: private, max-age=10" on user booking lists
+const USER_BOOKINGS_MAX_AGE_MS = 10_000;
+
 class BookingService {
   private baseUrl: string;
+  // When this client last changed a booking; list reads right after skip the browser cache
+  private lastWriteAt = 0;
 
   constructor() {
     this.baseUrl = BOOKING_SERVICE_BASE_URL;
@@ -73,7 +78,10 @@ class BookingService {
       ...(await this.authHeaders()),
     };
 
+    const isWrite = (options.method ?? "GET") !== "GET";
     const response = await fetch(url, {
+      // A cached list could predate a booking this client just made or changed
+      ...(!isWrite && Date.now() - this.lastWriteAt < USER_BOOKINGS_MAX_AGE_MS ? { cache: "no-cache" as RequestCache } : {}),
       ...options,
       headers: {
         ...defaultHeaders,
@@ -86,6 +94,10 @@ class BookingService {
       throw new Error(`HTTP ${response.status}: ${errorData}`);
     }
 
+    if (isWrite) {
+      this.lastWriteAt = Date.now();
+    }
+
     if (response.status === 204) {
       // Return a safe empty object cast for endpoints that return no content
       return {} as T;
@@ -215,9 +215,9 @@ export const gigServiceAPI: GigServiceAPI = {
     // Add all non-file fields to the form data
     Object.keys(gigData).forEach((key) => {
       if (key !== "certifications") {
-        // If it's an array, convert it to a string
+        // Arrays are sent as repeated fields, which the gig service reads as a list
         if (Array.isArray(gigData[key])) {
-          formData.append(key, gigData[key].join(","));
+          gigData[key].forEach((item) => formData.append(key, item));
         } else {
           formData.append(key, String(gigData[key]));
         }
@@ -3,7 +3,7 @@ from app.db import crud
 from app.db.schemas import BookingCreate, BookingUpdate, BookingResponse, BookingResponseWithGigDetails, GigDetails
 from app.db.models import Booking  # Import the Booking model
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
 from fastapi import status
 from app.core.logging import logger
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -11,11 +11,16 @@ from app.core.firebase_auth import get_current_user_id
 from app.utils.gig_service import get_gig_details
 from typing import List
 import uuid
-import uuid
 
 # Create router with explicit prefix to avoid path parameter conflicts
 router = APIRouter()
 
+# A user's booking list changes only when they act on it, so browsers may reuse it briefly;
+# "private" keeps shared caches from storing one user's bookings for another
+USER_BOOKINGS_CACHE_CONTROL = "private, max-age=10"
+# Responses to booking writes must never be served from a cache
+NO_STORE_CACHE_CONTROL = "no-store"
+
 # Define routes in order - fixed paths before path parameters
 
 # 1. Root endpoint - list all bookings
@@ -44,11 +49,13 @@ def get_bookings(skip: int = 0, limit: int = 100, db: Session = Depends(session.
 # 2. User-specific endpoints - important that these come before path parameters
 @router.get("/by-current-user", response_model=List[BookingResponseWithGigDetails])
 def get_bookings_by_user_new_endpoint(
+    response: Response,
     db: Session = Depends(session.get_db),
     current_user_id: str = Depends(get_current_user_id),
     include_gig_details: bool = True
 ):
     """Retrieve all bookings made by the current user with gig details (new endpoint)."""
+    response.headers["Cache-Control"] = USER_BOOKINGS_CACHE_CONTROL
     try:
         logger.info(f"Getting bookings for user: {current_user_id}")
         
@@ -111,10 +118,12 @@ def get_bookings_by_user_new_endpoint(
 # Also provide the original /user endpoint for backward compatibility
 @router.get("/user", response_model=List[BookingResponse])
 def get_bookings_by_user(
+    response: Response,
     db: Session = Depends(session.get_db),
     current_user_id: str = Depends(get_current_user_id)
 ):
     """Retrieve all bookings made by the current user (legacy endpoint)."""
+    response.headers["Cache-Control"] = USER_BOOKINGS_CACHE_CONTROL
     try:
         logger.info(f"Getting bookings for user (via legacy endpoint): {current_user_id}")
         
@@ -151,24 +160,14 @@ def get_bookings_by_user(
 # 3. Gig-specific endpoints - get bookings by gig
 @router.get("/gig/{gig_id}", response_model=List[BookingResponseWithGigDetails])
 def get_bookings_by_gig(
-    gig_id: str,
+    gig_id: uuid.UUID,
     db: Session = Depends(session.get_db),
     include_user_details: bool = True
 ):
     """Retrieve all bookings for a specific gig with user details."""
     try:
-        # Validate UUID format for gig_id
-        try:
-            uuid_obj = uuid.UUID(gig_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for gig_id: {gig_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid gig ID format. Must be a valid UUID."
-            )
-        
         logger.info(f"Getting bookings for gig: {gig_id}")
-        bookings = crud.get_bookings_by_gig(db=db, gig_id=str(uuid_obj))
+        bookings = crud.get_bookings_by_gig(db=db, gig_id=str(gig_id))
         logger.info(f"Found {len(bookings)} bookings for gig {gig_id}")
         
         # If user details are requested, fetch them for each booking
@@ -227,22 +226,12 @@ def get_bookings_by_gig(
 # 4. Available slots endpoint
 @router.get("/gigs/{gig_id}/available-slots")
 def get_available_slots(
-    gig_id: str,
+    gig_id: uuid.UUID,
     date: str,
     db: Session = Depends(session.get_db)
 ):
     """Get available time slots for a gig on a specific date."""
     try:
-        # Validate UUID format for gig_id
-        try:
-            uuid_obj = uuid.UUID(gig_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for gig_id: {gig_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid gig ID format. Must be a valid UUID."
-            )
-            
         # Validate date format
         try:
             from datetime import datetime
@@ -255,7 +244,7 @@ def get_available_slots(
             )
         
         # Get booked slots for the date
-        booked_slots = crud.get_booked_slots_for_date(db=db, gig_id=uuid_obj, date_str=date)
+        booked_slots = crud.get_booked_slots_for_date(db=db, gig_id=gig_id, date_str=date)
         
         # Return the booked times as ISO strings
         booked_times = [b.scheduled_time.isoformat() for b in booked_slots]
@@ -272,10 +261,12 @@ def get_available_slots(
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 def create_booking(
     booking: BookingCreate, 
+    response: Response,
     db: Session = Depends(session.get_db),
     current_user_id: str = Depends(get_current_user_id)
 ):
     """Create a new booking."""
+    response.headers["Cache-Control"] = NO_STORE_CACHE_CONTROL
     try:
         logger.info(f"Creating booking for user {current_user_id}, gig {booking.gig_id}")
         db_booking = crud.create_booking(db=db, booking=booking, user_id=current_user_id)
@@ -295,23 +286,13 @@ def create_booking(
 # 4. Path parameter routes come AFTER all fixed path routes
 @router.get("/{booking_id}", response_model=BookingResponse)
 def get_booking(
-    booking_id: str = Path(..., description="The ID of the booking to retrieve"), 
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to retrieve"), 
     db: Session = Depends(session.get_db)
 ):
     """Retrieve a booking by its ID."""
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-        
         logger.info(f"Getting booking with ID: {booking_id}")
-        db_booking = crud.get_booking(db=db, booking_id=str(uuid_obj))
+        db_booking = crud.get_booking(db=db, booking_id=str(booking_id))
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -327,21 +308,11 @@ def get_booking(
 
 @router.put("/{booking_id}/confirm", response_model=BookingResponse)
 def confirm_booking(
-    booking_id: str = Path(..., description="The ID of the booking to confirm"),
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to confirm"),
     db: Session = Depends(session.get_db)
 ):
     """Confirm a booking and generate Agora meeting link."""
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Confirming booking with ID: {booking_id}")
         
         # Generate unique channel name for Agora
@@ -353,7 +324,7 @@ def confirm_booking(
             meeting_link=channel_name
         )
         
-        db_booking = crud.update_booking(db=db, booking_id=str(uuid_obj), booking_update=booking_update)
+        db_booking = crud.update_booking(db=db, booking_id=str(booking_id), booking_update=booking_update)
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found for confirmation")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -371,27 +342,17 @@ def confirm_booking(
 
 @router.put("/{booking_id}/join", response_model=BookingResponse)
 def join_booking(
-    booking_id: str = Path(..., description="The ID of the booking to join"),
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to join"),
     db: Session = Depends(session.get_db)
 ):
     """Mark a booking as joined when user enters the meeting."""
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Marking booking as joined with ID: {booking_id}")
         
         # Update booking status to joined
         booking_update = BookingUpdate(status="joined")
         
-        db_booking = crud.update_booking(db=db, booking_id=str(uuid_obj), booking_update=booking_update)
+        db_booking = crud.update_booking(db=db, booking_id=str(booking_id), booking_update=booking_update)
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found for join")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -409,27 +370,17 @@ def join_booking(
 
 @router.put("/{booking_id}/complete", response_model=BookingResponse)
 def complete_booking(
-    booking_id: str = Path(..., description="The ID of the booking to complete"),
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to complete"),
     db: Session = Depends(session.get_db)
 ):
     """Mark a booking as completed when user clicks done."""
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Marking booking as completed with ID: {booking_id}")
         
         # Update booking status to completed
         booking_update = BookingUpdate(status="completed")
         
-        db_booking = crud.update_booking(db=db, booking_id=str(uuid_obj), booking_update=booking_update)
+        db_booking = crud.update_booking(db=db, booking_id=str(booking_id), booking_update=booking_update)
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found for completion")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -447,24 +398,14 @@ def complete_booking(
 
 @router.get("/verify/{booking_id}")
 def verify_booking(
-    booking_id: str = Path(..., description="The ID of the booking to verify"),
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to verify"),
     db: Session = Depends(session.get_db)
 ):
     """Verify booking exists and return details for review submission."""
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Verifying booking with ID: {booking_id}")
         
-        db_booking = crud.get_booking(db=db, booking_id=str(uuid_obj))
+        db_booking = crud.get_booking(db=db, booking_id=str(booking_id))
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -508,24 +449,16 @@ def verify_booking(
 
 @router.put("/{booking_id}", response_model=BookingResponse)
 def update_booking(
-    booking_id: str = Path(..., description="The ID of the booking to update"),
+    response: Response,
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to update"),
     booking_update: BookingUpdate = None, 
     db: Session = Depends(session.get_db)
 ):
     """Update an existing booking."""
+    response.headers["Cache-Control"] = NO_STORE_CACHE_CONTROL
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Updating booking with ID: {booking_id}")
-        db_booking = crud.update_booking(db=db, booking_id=str(uuid_obj), booking_update=booking_update)
+        db_booking = crud.update_booking(db=db, booking_id=str(booking_id), booking_update=booking_update)
         if not db_booking:
             logger.warning(f"Booking with ID {booking_id} not found for update")
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -541,23 +474,15 @@ def update_booking(
 
 @router.delete("/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_booking(
-    booking_id: str = Path(..., description="The ID of the booking to delete"),
+    response: Response,
+    booking_id: uuid.UUID = Path(..., description="The ID of the booking to delete"),
     db: Session = Depends(session.get_db)
 ):
     """Delete a booking by its ID."""
+    response.headers["Cache-Control"] = NO_STORE_CACHE_CONTROL
     try:
-        # Validate UUID format
-        try:
-            uuid_obj = uuid.UUID(booking_id)
-        except ValueError:
-            logger.warning(f"Invalid UUID format for booking_id: {booking_id}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid booking ID format. Must be a valid UUID."
-            )
-            
         logger.info(f"Deleting booking with ID: {booking_id}")
-        success = crud.delete_booking(db=db, booking_id=str(uuid_obj))
+        success = crud.delete_booking(db=db, booking_id=str(booking_id))
         if not success:
             logger.warning(f"Booking with ID {booking_id} not found for deletion")
             raise HTTPException(status_code=404, detail="Booking not found")
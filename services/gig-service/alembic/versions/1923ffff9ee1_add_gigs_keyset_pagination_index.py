@@ -0,0 +1,28 @@
+"""add_gigs_keyset_pagination_index
+
+Revision ID: 1923ffff9ee1
+Revises: e6a1bcf2cf79
+Create Date: 2026-10-18 12:26:48.150362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1923ffff9ee1'
+down_revision: Union[str, Sequence[str], None] = 'e6a1bcf2cf79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a (created_at DESC, id DESC) index for keyset pagination."""
+    op.create_index('ix_gigs_created_at_id', 'gigs', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the keyset pagination index."""
+    op.drop_index('ix_gigs_created_at_id', table_name='gigs')
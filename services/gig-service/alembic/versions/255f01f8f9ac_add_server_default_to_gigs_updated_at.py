@@ -0,0 +1,34 @@
+"""add_server_default_to_gigs_updated_at
+
+Revision ID: 255f01f8f9ac
+Revises: f13e4854c8ee
+Create Date: 2026-10-18 10:04:17.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '255f01f8f9ac'
+down_revision: Union[str, Sequence[str], None] = 'f13e4854c8ee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by letting the database fill gigs.updated_at on insert."""
+    op.alter_column('gigs', 'updated_at',
+                    existing_type=sa.DateTime(),
+                    server_default=sa.text('now()'),
+                    existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the updated_at server default."""
+    op.alter_column('gigs', 'updated_at',
+                    existing_type=sa.DateTime(),
+                    server_default=None,
+                    existing_nullable=True)
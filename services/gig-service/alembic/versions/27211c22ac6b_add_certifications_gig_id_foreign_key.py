@@ -0,0 +1,41 @@
+"""add_certifications_gig_id_foreign_key
+
+Revision ID: 27211c22ac6b
+Revises: 2f3532d9c15a
+Create Date: 2026-10-18 17:26:40.118562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27211c22ac6b'
+down_revision: Union[str, Sequence[str], None] = '2f3532d9c15a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by making certifications.gig_id a required foreign key that cascades gig deletes."""
+    # Certifications of gigs that no longer exist (or with no gig at all) cannot satisfy the constraint
+    op.execute("""
+        DELETE FROM certifications
+        WHERE gig_id IS NULL OR NOT EXISTS (SELECT 1 FROM gigs WHERE gigs.id = certifications.gig_id)
+    """)
+    op.alter_column('certifications', 'gig_id',
+                    existing_type=postgresql.UUID(as_uuid=True),
+                    nullable=False)
+    op.create_foreign_key('certifications_gig_id_fkey', 'certifications', 'gigs',
+                          ['gig_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema by dropping the certifications gig foreign key."""
+    op.drop_constraint('certifications_gig_id_fkey', 'certifications', type_='foreignkey')
+    op.alter_column('certifications', 'gig_id',
+                    existing_type=postgresql.UUID(as_uuid=True),
+                    nullable=True)
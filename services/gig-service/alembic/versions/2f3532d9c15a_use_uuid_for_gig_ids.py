@@ -0,0 +1,47 @@
+"""use_uuid_for_gig_ids
+
+Revision ID: 2f3532d9c15a
+Revises: c1e46ce33aa1
+Create Date: 2026-10-18 16:48:21.903177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f3532d9c15a'
+down_revision: Union[str, Sequence[str], None] = 'c1e46ce33aa1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by storing gig IDs and certification gig IDs as native 16-byte UUIDs."""
+    op.alter_column('gigs', 'id',
+                    existing_type=sa.String(length=36),
+                    type_=postgresql.UUID(as_uuid=True),
+                    postgresql_using='id::uuid',
+                    existing_nullable=False)
+    op.alter_column('certifications', 'gig_id',
+                    existing_type=sa.String(length=36),
+                    type_=postgresql.UUID(as_uuid=True),
+                    postgresql_using='gig_id::uuid',
+                    existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema by storing gig IDs as strings again."""
+    op.alter_column('certifications', 'gig_id',
+                    existing_type=postgresql.UUID(as_uuid=True),
+                    type_=sa.String(length=36),
+                    postgresql_using='gig_id::text',
+                    existing_nullable=True)
+    op.alter_column('gigs', 'id',
+                    existing_type=postgresql.UUID(as_uuid=True),
+                    type_=sa.String(length=36),
+                    postgresql_using='id::text',
+                    existing_nullable=False)
@@ -0,0 +1,28 @@
+"""add_gin_index_on_gigs_expertise_areas
+
+Revision ID: 707a06317d6f
+Revises: 1923ffff9ee1
+Create Date: 2026-10-18 13:08:19.472604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '707a06317d6f'
+down_revision: Union[str, Sequence[str], None] = '1923ffff9ee1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a GIN index for expertise area overlap filters."""
+    op.create_index('ix_gigs_expertise_areas', 'gigs', ['expertise_areas'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the expertise areas GIN index."""
+    op.drop_index('ix_gigs_expertise_areas', table_name='gigs', postgresql_using='gin')
@@ -0,0 +1,45 @@
+"""cap_gig_string_column_lengths
+
+Revision ID: 811beba11cc4
+Revises: 96ced428da01
+Create Date: 2026-10-18 14:22:51.307461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '811beba11cc4'
+down_revision: Union[str, Sequence[str], None] = '96ced428da01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, bounded length)
+_CAPPED_COLUMNS = [
+    ('gigs', 'expert_id', 128),
+    ('gigs', 'currency', 3),
+    ('gigs', 'response_time', 32),
+    ('gigs', 'thumbnail_url', 2000),
+    ('certifications', 'gig_id', 36),
+    ('certifications', 'url', 2000),
+    ('certifications', 'thumbnail_url', 2000),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema by giving the unbounded gig/certification VARCHAR columns explicit lengths."""
+    for table, column, length in _CAPPED_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.String(),
+                        type_=sa.String(length=length))
+
+
+def downgrade() -> None:
+    """Downgrade schema by making the capped columns unbounded VARCHAR again."""
+    for table, column, length in _CAPPED_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.String(length=length),
+                        type_=sa.String())
@@ -0,0 +1,31 @@
+"""add_gigs_search_trigram_index
+
+Revision ID: 96ced428da01
+Revises: 707a06317d6f
+Create Date: 2026-10-18 13:41:08.522617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96ced428da01'
+down_revision: Union[str, Sequence[str], None] = '707a06317d6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a pg_trgm GIN index for substring searches on service_description."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_gigs_search_trgm', 'gigs', ['service_description'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'service_description': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the trigram search index."""
+    op.drop_index('ix_gigs_search_trgm', table_name='gigs', postgresql_using='gin',
+                  postgresql_ops={'service_description': 'gin_trgm_ops'})
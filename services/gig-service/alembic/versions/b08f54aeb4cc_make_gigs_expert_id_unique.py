@@ -0,0 +1,30 @@
+"""make_gigs_expert_id_unique
+
+Revision ID: b08f54aeb4cc
+Revises: e34785c9dead
+Create Date: 2026-10-18 11:02:36.914257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b08f54aeb4cc'
+down_revision: Union[str, Sequence[str], None] = 'e34785c9dead'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by making the expert_id index unique (one gig per expert)."""
+    op.drop_index(op.f('ix_gigs_expert_id'), table_name='gigs')
+    op.create_index(op.f('ix_gigs_expert_id'), 'gigs', ['expert_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema by restoring the non-unique expert_id index."""
+    op.drop_index(op.f('ix_gigs_expert_id'), table_name='gigs')
+    op.create_index(op.f('ix_gigs_expert_id'), 'gigs', ['expert_id'], unique=False)
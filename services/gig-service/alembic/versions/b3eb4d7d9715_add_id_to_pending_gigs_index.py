@@ -0,0 +1,32 @@
+"""add_id_to_pending_gigs_index
+
+Revision ID: b3eb4d7d9715
+Revises: 27211c22ac6b
+Create Date: 2026-10-18 18:05:12.437915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3eb4d7d9715'
+down_revision: Union[str, Sequence[str], None] = '27211c22ac6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by extending the pending gigs partial index to the full (created_at DESC, id DESC) keyset."""
+    op.drop_index('ix_gigs_pending_created_at', table_name='gigs', postgresql_where=sa.text('status = 0'))
+    op.create_index('ix_gigs_pending_created_at', 'gigs', [sa.text('created_at DESC'), sa.text('id DESC')],
+                    unique=False, postgresql_where=sa.text('status = 0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema by indexing pending gigs on created_at only."""
+    op.drop_index('ix_gigs_pending_created_at', table_name='gigs', postgresql_where=sa.text('status = 0'))
+    op.create_index('ix_gigs_pending_created_at', 'gigs', ['created_at'], unique=False,
+                    postgresql_where=sa.text('status = 0'))
@@ -0,0 +1,85 @@
+"""store_gig_status_as_smallint
+
+Revision ID: c1e46ce33aa1
+Revises: c60164f95d8f
+Create Date: 2026-10-18 16:12:07.514329
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1e46ce33aa1'
+down_revision: Union[str, Sequence[str], None] = 'c60164f95d8f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Codes match app.db.models.GIG_STATUS_CODES. Legacy labels from the initial enum are folded
+# into the statuses the application uses (DRAFT -> PENDING, APPROVED -> ACTIVE, INACTIVE -> HOLD).
+_STATUS_TO_CODE = """
+    CASE status::text
+        WHEN 'PENDING' THEN 0 WHEN 'DRAFT' THEN 0
+        WHEN 'ACTIVE' THEN 1 WHEN 'APPROVED' THEN 1
+        WHEN 'HOLD' THEN 2 WHEN 'INACTIVE' THEN 2
+        WHEN 'REJECTED' THEN 3
+    END
+"""
+_CODE_TO_STATUS = """
+    CASE status_code
+        WHEN 0 THEN 'PENDING' WHEN 1 THEN 'ACTIVE' WHEN 2 THEN 'INACTIVE' WHEN 3 THEN 'REJECTED'
+    END::gigstatus
+"""
+_LEGACY_STATUS_LABELS = ('DRAFT', 'PENDING', 'APPROVED', 'REJECTED', 'ACTIVE', 'INACTIVE')
+
+
+def _drop_status_dependents() -> None:
+    """Drops the view and indexes that reference gigs.status so the column can be replaced."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS gig_daily_active_counts")
+    op.drop_index('ix_gigs_active_created_at', table_name='gigs')
+    op.drop_index('ix_gigs_pending_created_at', table_name='gigs')
+    op.drop_index('ix_gigs_status_category_rate', table_name='gigs')
+
+
+def _create_status_dependents(pending: str, active: str) -> None:
+    """Recreates the status indexes and the daily active counts view for the given status literals."""
+    op.create_index('ix_gigs_status_category_rate', 'gigs', ['status', 'category_id', 'hourly_rate'], unique=False)
+    op.create_index('ix_gigs_pending_created_at', 'gigs', ['created_at'], unique=False,
+                    postgresql_where=sa.text(f"status = {pending}"))
+    op.create_index('ix_gigs_active_created_at', 'gigs', ['created_at'], unique=False,
+                    postgresql_where=sa.text(f"status = {active}"))
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW gig_daily_active_counts AS
+        SELECT DATE(created_at) AS day, COUNT(*) AS new_gigs
+        FROM gigs
+        WHERE status = {active} AND created_at IS NOT NULL
+        GROUP BY DATE(created_at)
+    """)
+    op.create_index('ix_gig_daily_active_counts_day', 'gig_daily_active_counts', ['day'], unique=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema by replacing the gigstatus enum column with a SMALLINT status code."""
+    _drop_status_dependents()
+    op.add_column('gigs', sa.Column('status_code', sa.SmallInteger(), nullable=True))
+    op.execute(f"UPDATE gigs SET status_code = {_STATUS_TO_CODE}")
+    op.drop_column('gigs', 'status')
+    op.alter_column('gigs', 'status_code', new_column_name='status')
+    postgresql.ENUM(name='gigstatus').drop(op.get_bind(), checkfirst=True)
+    _create_status_dependents(pending="0", active="1")
+    op.execute("ANALYZE gigs")
+
+
+def downgrade() -> None:
+    """Downgrade schema by restoring the gigstatus enum column from the status codes."""
+    _drop_status_dependents()
+    op.alter_column('gigs', 'status', new_column_name='status_code')
+    gigstatus = postgresql.ENUM(*_LEGACY_STATUS_LABELS, name='gigstatus')
+    gigstatus.create(op.get_bind(), checkfirst=True)
+    op.add_column('gigs', sa.Column('status', gigstatus, nullable=True))
+    op.execute(f"UPDATE gigs SET status = {_CODE_TO_STATUS}")
+    op.drop_column('gigs', 'status_code')
+    _create_status_dependents(pending="'PENDING'", active="'ACTIVE'")
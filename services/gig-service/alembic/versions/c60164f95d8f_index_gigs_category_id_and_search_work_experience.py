@@ -0,0 +1,47 @@
+"""index_gigs_category_id_and_search_work_experience
+
+Revision ID: c60164f95d8f
+Revises: f2a781f72429
+Create Date: 2026-10-18 15:31:44.180263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c60164f95d8f'
+down_revision: Union[str, Sequence[str], None] = 'f2a781f72429'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SEARCH_TSV_WITH_WORK_EXPERIENCE = (
+    "to_tsvector('english', coalesce(service_description, '') || ' ' || coalesce(work_experience, ''))"
+)
+_SEARCH_TSV_DESCRIPTION_ONLY = "to_tsvector('english', coalesce(service_description, ''))"
+
+
+def _recreate_search_tsv(expression: str) -> None:
+    """Postgres cannot alter a generated column's expression, so the column and its index are rebuilt."""
+    op.drop_index('ix_gigs_search_tsv', table_name='gigs', postgresql_using='gin')
+    op.drop_column('gigs', 'search_tsv')
+    op.add_column('gigs',
+                  sa.Column('search_tsv', postgresql.TSVECTOR(),
+                            sa.Computed(expression, persisted=True),
+                            nullable=True))
+    op.create_index('ix_gigs_search_tsv', 'gigs', ['search_tsv'], unique=False, postgresql_using='gin')
+
+
+def upgrade() -> None:
+    """Upgrade schema by indexing the category foreign key and adding work experience to the search vector."""
+    op.create_index(op.f('ix_gigs_category_id'), 'gigs', ['category_id'], unique=False)
+    _recreate_search_tsv(_SEARCH_TSV_WITH_WORK_EXPERIENCE)
+
+
+def downgrade() -> None:
+    """Downgrade schema by restoring the description-only search vector and dropping the category index."""
+    _recreate_search_tsv(_SEARCH_TSV_DESCRIPTION_ONLY)
+    op.drop_index(op.f('ix_gigs_category_id'), table_name='gigs')
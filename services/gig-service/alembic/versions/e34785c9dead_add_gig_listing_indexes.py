@@ -0,0 +1,32 @@
+"""add_gig_listing_indexes
+
+Revision ID: e34785c9dead
+Revises: 255f01f8f9ac
+Create Date: 2026-10-18 10:31:52.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e34785c9dead'
+down_revision: Union[str, Sequence[str], None] = '255f01f8f9ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding indexes for the gig listing filters and the pending review queue."""
+    op.create_index('ix_gigs_status_category_rate', 'gigs', ['status', 'category_id', 'hourly_rate'], unique=False)
+    op.create_index('ix_gigs_pending_created_at', 'gigs', ['created_at'], unique=False,
+                    postgresql_where=sa.text("status = 'PENDING'"))
+    op.execute("ANALYZE gigs")
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the gig listing indexes."""
+    op.drop_index('ix_gigs_pending_created_at', table_name='gigs', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('ix_gigs_status_category_rate', table_name='gigs')
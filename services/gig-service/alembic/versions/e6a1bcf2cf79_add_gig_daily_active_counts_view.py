@@ -0,0 +1,36 @@
+"""add_gig_daily_active_counts_view
+
+Revision ID: e6a1bcf2cf79
+Revises: b08f54aeb4cc
+Create Date: 2026-10-18 11:47:05.381926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1bcf2cf79'
+down_revision: Union[str, Sequence[str], None] = 'b08f54aeb4cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a materialized view of active gigs created per day for analytics."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW gig_daily_active_counts AS
+        SELECT DATE(created_at) AS day, COUNT(*) AS new_gigs
+        FROM gigs
+        WHERE status = 'ACTIVE' AND created_at IS NOT NULL
+        GROUP BY DATE(created_at)
+    """)
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ix_gig_daily_active_counts_day', 'gig_daily_active_counts', ['day'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema by dropping the daily active gig counts view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS gig_daily_active_counts")
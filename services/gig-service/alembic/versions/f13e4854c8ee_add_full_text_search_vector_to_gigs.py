@@ -0,0 +1,34 @@
+"""add_full_text_search_vector_to_gigs
+
+Revision ID: f13e4854c8ee
+Revises: f7240731c4ab
+Create Date: 2026-10-18 09:12:41.532907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f13e4854c8ee'
+down_revision: Union[str, Sequence[str], None] = 'f7240731c4ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a generated tsvector column with a GIN index for gig search."""
+    op.add_column('gigs',
+                  sa.Column('search_tsv', postgresql.TSVECTOR(),
+                            sa.Computed("to_tsvector('english', coalesce(service_description, ''))", persisted=True),
+                            nullable=True))
+    op.create_index('ix_gigs_search_tsv', 'gigs', ['search_tsv'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the search vector and its index."""
+    op.drop_index('ix_gigs_search_tsv', table_name='gigs', postgresql_using='gin')
+    op.drop_column('gigs', 'search_tsv')
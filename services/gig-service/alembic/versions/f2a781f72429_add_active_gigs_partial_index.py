@@ -0,0 +1,29 @@
+"""add_active_gigs_partial_index
+
+Revision ID: f2a781f72429
+Revises: 811beba11cc4
+Create Date: 2026-10-18 14:48:13.660952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a781f72429'
+down_revision: Union[str, Sequence[str], None] = '811beba11cc4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema by adding a partial index over the creation time of active gigs."""
+    op.create_index('ix_gigs_active_created_at', 'gigs', ['created_at'], unique=False,
+                    postgresql_where=sa.text("status = 'ACTIVE'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema by removing the active gigs partial index."""
+    op.drop_index('ix_gigs_active_created_at', table_name='gigs', postgresql_where=sa.text("status = 'ACTIVE'"))
@@ -17,5 +17,9 @@ class Settings(BaseSettings):
     cloudinary_api_secret: Optional[str] = Field(default=None, alias="CLOUDINARY_API_SECRET")
     cloudinary_base_folder: str = Field(default="gig-service", alias="CLOUDINARY_BASE_FOLDER")
 
+    # User service, called to generate availability slots for newly created gigs
+    user_service_url: str = Field(default="http://localhost:8006", alias="USER_SERVICE_URL")
+    service_api_key: Optional[str] = Field(default=None, alias="SERVICE_API_KEY")
+
 
 settings = Settings()
@@ -1,242 +1,543 @@
+import re
 import uuid
-from datetime import datetime
-from typing import List, Optional, Any
-from sqlalchemy.orm import Session , joinedload
-from sqlalchemy import or_
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Any, Tuple, NamedTuple
+from sqlalchemy.orm import Session , joinedload, load_only, selectinload, raiseload, lazyload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import or_, select, bindparam, tuple_, delete, update, insert, func, text, cast, String
+from sqlalchemy.dialects.postgresql import ARRAY
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import the correct models and schemas for your new structure
 from .models import Gig, Category, GigStatus, Certification
-from .schemas import GigCreate, GigUpdate, GigFilters, CategoryCreate
+from .schemas import GigCreate, GigUpdate, GigFilters, CategoryCreate, Category as CategorySnapshot
+from app.core.config import settings
 from app.utils.logger import get_logger
+from app.utils.cache import LockedTTLCache
 
 # Get logger for this module
 logger = get_logger(__name__)
 
-
+# Canonical hyphenated UUID; lets category lookups tell IDs from slugs without raising
+_UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+# Every category as detached schema snapshots (never session-bound ORM instances), looked up
+# by UUID and by lower-cased slug. Categories are few and rarely change, so the whole table is
+# loaded in one query per cache period; create_category drops it.
+_category_map_cache = LockedTTLCache(maxsize=1, ttl=300)
+
+# Filtered gig totals for pagination change slowly, so they are cached briefly
+# (keyed on the filter values) and dropped whenever gigs are written.
+_gig_count_cache = LockedTTLCache(maxsize=1024, ttl=30)
+
+# Rendered public listing pages (JSON bytes) keyed on filters and page. The public listing is
+# the same for every visitor, so repeated browsing of a page is served without a query;
+# dropped together with the gig counts whenever gigs are written.
+public_gig_page_cache = LockedTTLCache(maxsize=1024, ttl=15)
+
+# Rendered public gig detail responses (JSON bytes) keyed on gig ID, for active gigs only.
+gig_detail_cache = LockedTTLCache(maxsize=4096, ttl=60)
+
+
+# Bumped by every invalidation. A reader notes the generation before its query and stores the
+# result only if it is unchanged, so a write committed while the query ran (whose invalidation
+# found nothing to drop yet) can't leave the stale result cached for a whole TTL.
+_gig_cache_generation = 0
+_gig_cache_lock = threading.Lock()
+
+
+def gig_cache_generation() -> int:
+    """Current gig cache generation; read it before querying data that will be cached."""
+    return _gig_cache_generation
+
+
+def store_gig_cache_entry(cache: LockedTTLCache, key: Any, value: Any, generation: int) -> None:
+    """Caches `value` unless gig caches were invalidated since `generation` was read."""
+    with _gig_cache_lock:
+        if generation == _gig_cache_generation:
+            cache[key] = value
+
+
+def _invalidate_gig_caches() -> None:
+    """Drops cached gig counts, rendered listing pages and gig details after a gig write."""
+    global _gig_cache_generation
+    with _gig_cache_lock:
+        _gig_cache_generation += 1
+        _gig_count_cache.clear()
+        public_gig_page_cache.clear()
+        gig_detail_cache.clear()
+
+
+def _invalidate_gig_detail(gig_id: uuid.UUID) -> None:
+    """Drops one gig's cached detail after a write that only affects the detail view."""
+    global _gig_cache_generation
+    with _gig_cache_lock:
+        _gig_cache_generation += 1
+        gig_detail_cache.pop(gig_id, None)
+
+# Columns serialized by the gig list responses (schemas.Gig). List queries load only
+# these, skipping availability_preferences and the certification URL array.
+GIG_LIST_COLUMNS = (
+    Gig.id, Gig.expert_id, Gig.category_id, Gig.service_description, Gig.hourly_rate,
+    Gig.currency, Gig.response_time, Gig.thumbnail_url, Gig.expertise_areas,
+    Gig.experience_years, Gig.work_experience, Gig.status,
+    Gig.created_at, Gig.updated_at, Gig.approved_at,
+)
+
+# Columns of a public search result card (schemas.GigListItem, plus category_id to attach
+# the category). The public listing selects these as plain rows, skipping ORM hydration.
+GIG_LIST_ITEM_COLUMNS = (
+    Gig.id, Gig.expert_id, Gig.category_id, Gig.service_description, Gig.hourly_rate,
+    Gig.currency, Gig.response_time, Gig.thumbnail_url, Gig.expertise_areas,
+    Gig.experience_years, Gig.status, Gig.created_at,
+)
+
+# List pages load categories with one extra "WHERE id IN (...)" SELECT instead of widening
+# every row with a JOIN, and refuse any other lazy load the list responses never serialize.
+_GIG_LIST_OPTIONS = (load_only(*GIG_LIST_COLUMNS), selectinload(Gig.category), raiseload('*'))
+# Hot list pages (public, all, pending) skip the category load entirely; their endpoints
+# attach categories from the in-process cache (get_categories_for_gigs).
+_GIG_LIST_ROW_OPTIONS = (load_only(*GIG_LIST_COLUMNS), raiseload('*'))
+
+# Hot single-row lookups are built once at import time with bound parameters, so every
+# call reuses the same statement object and hits SQLAlchemy's compiled statement cache.
+# Single-gig responses nest the category, so it comes back in the same query (a JOIN)
+# rather than from the relationship's default selectin load, a second SELECT
+_GIG_BY_ID_STMT = (select(Gig)
+                   .options(joinedload(Gig.category))
+                   .where(Gig.id == bindparam('gig_id')))
+_GIG_BY_EXPERT_STMT = (select(Gig)
+                       .options(joinedload(Gig.category))
+                       .where(Gig.expert_id == bindparam('expert_id')))
+_GIGS_BY_EXPERT_STMT = (select(Gig)
+                        .options(*_GIG_LIST_OPTIONS)
+                        .where(Gig.expert_id == bindparam('expert_id'))
+                        .offset(bindparam('skip'))
+                        .limit(bindparam('limit')))
+_GIG_WITH_CERTIFICATIONS_STMT = (select(Gig)
+                                 .options(joinedload(Gig.certifications))
+                                 .where(Gig.id == bindparam('gig_id')))
+_PENDING_GIGS_STMT = (select(Gig)
+                      .options(*_GIG_LIST_ROW_OPTIONS)
+                      .where(Gig.status == GigStatus.PENDING)
+                      .order_by(Gig.created_at.desc(), Gig.id.desc())
+                      .offset(bindparam('skip'))
+                      .limit(bindparam('limit')))
+_PENDING_GIGS_AFTER_STMT = (select(Gig)
+                            .options(*_GIG_LIST_ROW_OPTIONS)
+                            .where(Gig.status == GigStatus.PENDING,
+                                   tuple_(Gig.created_at, Gig.id)
+                                   < tuple_(bindparam('after_created_at'), bindparam('after_id')))
+                            .order_by(Gig.created_at.desc(), Gig.id.desc())
+                            .limit(bindparam('limit')))
+_GIGS_BY_STATUS_STMT = (select(Gig)
+                        .options(*_GIG_LIST_ROW_OPTIONS)
+                        .where(Gig.status == bindparam('status'))
+                        .order_by(Gig.created_at.desc(), Gig.id.desc())
+                        .offset(bindparam('skip'))
+                        .limit(bindparam('limit')))
+_CERTIFICATIONS_BY_GIG_STMT = select(Certification).where(Certification.gig_id == bindparam('gig_id'))
+
+
+class CategoryMap(NamedTuple):
+    """All categories, in creation order, indexed by UUID and by lower-cased slug."""
+    by_id: dict
+    by_slug: dict
 
 
 def create_category(db: Session, category: CategoryCreate) -> Category:
     """Creates a new category in the database."""
-    logger.info(f"Creating new category: {category.name}")
-    db_category = Category(name=category.name, slug=category.slug)
-    db.add(db_category)
+    logger.info("Creating new category: %s", category.name)
+    # INSERT ... RETURNING yields the row with its server-side created_at, no refresh SELECT
+    db_category = db.execute(
+        insert(Category).values(name=category.name, slug=category.slug).returning(Category)
+    ).scalar_one()
     db.commit()
-    db.refresh(db_category)
-    logger.info(f"Category created with ID: {db_category.id}")
+    _category_map_cache.clear()
+    logger.info("Category created with ID: %s", db_category.id)
     return db_category
 
-def get_all_categories(db: Session, skip: int = 0, limit: int = 100) -> list[type[Category]]:
-    """Retrieves a list of all categories."""
-    logger.info(f"Retrieving all categories with skip={skip}, limit={limit}")
-    categories = db.query(Category).offset(skip).limit(limit).all()
-    logger.info(f"Retrieved {len(categories)} categories")
+def get_category_map(db: Session, refresh: bool = False) -> CategoryMap:
+    """
+    Returns the cached map of every category, loading the whole table in one query when
+    the cache is empty, expired or `refresh` is set.
+    """
+    category_map = None if refresh else _category_map_cache.get('map')
+    if category_map is None:
+        categories = [CategorySnapshot.model_validate(c) for c in
+                      db.execute(select(Category).order_by(Category.created_at, Category.id)).scalars()]
+        category_map = CategoryMap(
+            by_id={c.id: c for c in categories},
+            by_slug={c.slug.lower(): c for c in categories},
+        )
+        _category_map_cache['map'] = category_map
+    return category_map
+
+def _lookup_category(category_map: CategoryMap, category_id: str) -> Optional[CategorySnapshot]:
+    """Finds a category in the map by UUID (any case) or by slug (case-insensitive)."""
+    if _UUID_RE.match(category_id):
+        return category_map.by_id.get(uuid.UUID(category_id))
+    return category_map.by_slug.get(category_id.lower())
+
+def get_all_categories(db: Session, skip: int = 0, limit: int = 100) -> List[CategorySnapshot]:
+    """Retrieves a list of all categories (cached for a few minutes)."""
+    logger.info("Retrieving all categories with skip=%s, limit=%s", skip, limit)
+    categories = list(get_category_map(db).by_id.values())[skip:skip + limit]
+    logger.info("Retrieved %s categories", len(categories))
     return categories
 
-def get_category(db: Session, category_id: str) -> Optional[Category]:
+def get_category(db: Session, category_id: str) -> Optional[CategorySnapshot]:
     """
-    Retrieves a single category by its ID or slug.
-    If category_id is a UUID, search by ID.
-    If category_id is a string that's not a valid UUID, search by slug.
+    Retrieves a single category by its ID or slug from the category map.
+    A value missing from the cached map (e.g. created by another worker) forces one reload.
     """
-    logger.info(f"Retrieving category with ID or slug: {category_id}")
-    
-    # Try to parse as UUID first
-    try:
-        # If it's a valid UUID, search by ID
-        uuid_obj = uuid.UUID(category_id)
-        category = db.query(Category).filter(Category.id == uuid_obj).first()
-    except (ValueError, TypeError):
-        # If it's not a valid UUID, search by slug
-        logger.info(f"Category ID {category_id} is not a valid UUID, searching by slug instead")
-        category = db.query(Category).filter(Category.slug == category_id).first()
-    
+    logger.info("Retrieving category with ID or slug: %s", category_id)
+    category_id = str(category_id).strip()
+    category = _lookup_category(get_category_map(db), category_id)
+    if category is None:
+        category = _lookup_category(get_category_map(db, refresh=True), category_id)
+
     if category:
-        logger.info(f"Category found: {category.name}")
+        logger.info("Category found: %s", category.name)
     else:
-        logger.warning(f"Category with ID/slug {category_id} not found")
-    
+        logger.warning("Category with ID/slug %s not found", category_id)
     return category
 
+def get_categories_for_gigs(db: Session, gigs) -> dict:
+    """
+    Returns {category_id: category snapshot} covering the given gigs from the category map;
+    a category missing from the cached map forces one reload.
+    """
+    categories = get_category_map(db).by_id
+    if any(gig.category_id not in categories for gig in gigs):
+        categories = get_category_map(db, refresh=True).by_id
+    return categories
 
+def resolve_category_id(db: Session, category_id: str) -> Optional[uuid.UUID]:
+    """Resolves a category ID or slug to the category's UUID."""
+    category = get_category(db, category_id)
+    return category.id if category else None
 
 
 def create_gig(db: Session, gig: GigCreate, expert_id: str) -> Gig:
     """Creates a new gig for a specific expert."""
-    logger.info(f"Creating new gig for expert ID: {expert_id}")
-    logger.debug(f"Gig data: {gig.dict()}")
+    logger.info("Creating new gig for expert ID: %s", expert_id)
     
     # Convert Pydantic model to dict, excluding any None values and specific fields we handle separately
-    gig_data = {k: v for k, v in gig.dict().items() if v is not None and k not in ['category_id', 'certificates']}
+    gig_data = gig.dict(exclude_none=True, exclude={'category_id'})
     
-    # Get category by ID or slug
-    category = get_category(db, str(gig.category_id))
-    if not category:
-        logger.error(f"Category with ID/slug {gig.category_id} not found")
-        raise ValueError(f"Category with ID/slug {gig.category_id} not found")
+    if _UUID_RE.match(gig.category_id):
+        # Use the UUID as-is; the categories FK rejects unknown IDs, so no lookup SELECT is needed
+        category_id = uuid.UUID(gig.category_id)
+    else:
+        # Get category by slug
+        category_id = resolve_category_id(db, gig.category_id)
+        if not category_id:
+            logger.error("Category with ID/slug %s not found", gig.category_id)
+            raise ValueError(f"Category with ID/slug {gig.category_id} not found")
     
     # Generate gig ID
-    gig_id = str(uuid.uuid4())
-
-    db_gig = Gig(
-        id=gig_id,
-        expert_id=expert_id,
-        category_id=category.id,  # Use the actual UUID from the retrieved category
-        status=GigStatus.PENDING,  # Gigs start as pending by default
-        currency="LKR",
-        response_time="< 24 hours",
-        **gig_data
-    )
-    db.add(db_gig)
+    gig_id = uuid.uuid4()
+
+    # INSERT ... RETURNING hands back the populated row, so no refresh SELECT is needed.
+    # The category is left to load on access (skipping the relationship's selectin query):
+    # the create endpoint attaches it from the category cache.
+    try:
+        db_gig = db.execute(
+            insert(Gig)
+            .options(lazyload(Gig.category))
+            .values(
+                id=gig_id,
+                expert_id=expert_id,
+                category_id=category_id,  # Use the actual UUID of the resolved category
+                status=GigStatus.PENDING,  # Gigs start as pending by default
+                currency="LKR",
+                response_time="< 24 hours",
+                **gig_data
+            )
+            .returning(Gig)
+        ).scalar_one()
+    except IntegrityError as e:
+        # 23503 = foreign_key_violation; anything else (e.g. a duplicate expert) propagates
+        if getattr(e.orig, 'pgcode', None) != '23503':
+            raise
+        db.rollback()
+        logger.error("Category with ID/slug %s not found", gig.category_id)
+        raise ValueError(f"Category with ID/slug {gig.category_id} not found") from e
     db.commit()
-    db.refresh(db_gig)
-    logger.info(f"Gig created successfully with ID: {gig_id}")
+    _invalidate_gig_caches()
+    logger.info("Gig created successfully with ID: %s", gig_id)
+    # Slot generation runs in the background so the user service round trip is off the request path
+    _SLOT_EXECUTOR.submit(_generate_slots_best_effort, expert_id)
+    return db_gig
+
+# Small pool for fire-and-forget calls to the user service
+_SLOT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gig-slots")
+SLOT_GENERATION_DAYS = 30
+# (connect, read) timeouts in seconds
+SLOT_GENERATION_TIMEOUT = (0.5, 2.0)
+
+# Shared keep-alive connection pool for user service calls, with a couple of quick retries
+_HTTP = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                            max_retries=Retry(total=2, backoff_factor=0.1))
+_HTTP.mount("http://", _http_adapter)
+_HTTP.mount("https://", _http_adapter)
+
+
+def _generate_slots_best_effort(expert_id: str) -> None:
+    """Asks the user service to generate availability slots for an expert; failures are only logged."""
     try:
-        # Call user service to generate availability slots
-        requests.post(
+        response = _HTTP.post(
             f"{settings.user_service_url}/users/{expert_id}/generate-slots",
             json={
                 "start_date": datetime.now().strftime("%Y-%m-%d"),
-                "end_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+                "end_date": (datetime.now() + timedelta(days=SLOT_GENERATION_DAYS)).strftime("%Y-%m-%d")
             },
             headers={
-                "X-Service-Key": settings.service_api_key
-            }
+                "X-Service-Key": settings.service_api_key or ""
+            },
+            timeout=SLOT_GENERATION_TIMEOUT
         )
+        response.raise_for_status()
+        logger.info("Availability slots generated for expert %s", expert_id)
     except Exception as e:
-        logger.error(f"Failed to generate availability slots: {e}")
-        # Continue with gig creation even if slot generation fails
-        
-    return db_gig
+        # Gig creation has already succeeded; slot generation is best effort
+        logger.error("Failed to generate availability slots for expert %s: %s", expert_id, e)
+
+GIG_BULK_INSERT_BATCH_SIZE = 1000
+
+
+def create_gigs_bulk(db: Session, gigs: List[Tuple[str, GigCreate]]) -> List[uuid.UUID]:
+    """
+    Creates many gigs at once (e.g. seeding or imports).
+    Takes (expert_id, gig) pairs, resolves every category ID (any case) or slug from the
+    category map, reloading it at most once, and inserts the rows with multi-row INSERTs
+    in a single transaction.
+    """
+    logger.info("Bulk creating %s gigs", len(gigs))
+    if not gigs:
+        return []
+
+    category_keys = {gig.category_id: str(gig.category_id).strip() for _, gig in gigs}
+    category_map = get_category_map(db)
+    if any(_lookup_category(category_map, key) is None for key in category_keys.values()):
+        # A category missing from the cached map (e.g. created by another worker) forces one reload
+        category_map = get_category_map(db, refresh=True)
+
+    rows = []
+    for expert_id, gig in gigs:
+        category = _lookup_category(category_map, category_keys[gig.category_id])
+        if category is None:
+            logger.error("Category with ID/slug %s not found", gig.category_id)
+            raise ValueError(f"Category with ID/slug {gig.category_id} not found")
+        rows.append({
+            "id": uuid.uuid4(),
+            "expert_id": expert_id,
+            "category_id": category.id,
+            "status": GigStatus.PENDING,
+            "currency": "LKR",
+            "response_time": "< 24 hours",
+            **gig.dict(exclude={"category_id"}),
+        })
+
+    for start in range(0, len(rows), GIG_BULK_INSERT_BATCH_SIZE):
+        db.execute(insert(Gig), rows[start:start + GIG_BULK_INSERT_BATCH_SIZE])
+    db.commit()
+    _invalidate_gig_caches()
+    logger.info("Bulk created %s gigs", len(rows))
+    return [row["id"] for row in rows]
 
-def get_gig(db: Session, gig_id: str) -> Optional[Gig]:
+def get_gig(db: Session, gig_id: uuid.UUID) -> Optional[Gig]:
     """Retrieves a single gig by its ID."""
-    logger.info(f"Retrieving gig with ID: {gig_id}")
-    gig = db.query(Gig).filter(Gig.id == gig_id).first()
+    logger.info("Retrieving gig with ID: %s", gig_id)
+    gig = db.execute(_GIG_BY_ID_STMT, {'gig_id': gig_id}).scalar_one_or_none()
     if gig:
-        logger.info(f"Gig found with ID: {gig_id}")
+        logger.info("Gig found with ID: %s", gig_id)
     else:
-        logger.warning(f"Gig with ID {gig_id} not found")
+        logger.warning("Gig with ID %s not found", gig_id)
+    return gig
+
+def get_gig_with_certifications(db: Session, gig_id: uuid.UUID) -> Optional[Gig]:
+    """Retrieves a single gig with its certifications loaded in the same query."""
+    logger.info("Retrieving gig with certifications for ID: %s", gig_id)
+    # joinedload of a collection needs unique() to collapse the per-certification rows
+    gig = db.execute(_GIG_WITH_CERTIFICATIONS_STMT, {'gig_id': gig_id}).unique().scalar_one_or_none()
+    if not gig:
+        logger.warning("Gig with ID %s not found", gig_id)
     return gig
 
 def get_gigs_by_expert(db: Session, expert_id: str, skip: int = 0, limit: int = 100) -> list[type[Gig]]:
     """Retrieves all gigs created by a specific expert."""
-    logger.info(f"Retrieving gigs for expert ID: {expert_id} with skip={skip}, limit={limit}")
-    gigs = (db.query(Gig)
-            .options(joinedload(Gig.category))
-            .filter(Gig.expert_id == expert_id)
-            .offset(skip)
-            .limit(limit)
-            .all())
-    logger.info(f"Found {len(gigs)} gigs for expert ID: {expert_id}")
+    logger.info("Retrieving gigs for expert ID: %s with skip=%s, limit=%s", expert_id, skip, limit)
+    gigs = db.execute(
+        _GIGS_BY_EXPERT_STMT, {'expert_id': expert_id, 'skip': skip, 'limit': limit}
+    ).scalars().all()
+    logger.info("Found %s gigs for expert ID: %s", len(gigs), expert_id)
     return gigs
 
 def get_gig_by_expert(db: Session, expert_id: str) -> Optional[Gig]:
     """Retrieves a single gig by expert ID (since one expert can have only one gig)."""
-    logger.info(f"Retrieving gig for expert ID: {expert_id}")
-    gig = (db.query(Gig)
-           .options(joinedload(Gig.category))
-           .filter(Gig.expert_id == expert_id)
-           .first())
+    logger.info("Retrieving gig for expert ID: %s", expert_id)
+    gig = db.execute(_GIG_BY_EXPERT_STMT, {'expert_id': expert_id}).scalar_one_or_none()
     if gig:
-        logger.info(f"Found gig ID: {gig.id} for expert ID: {expert_id}")
+        logger.info("Found gig ID: %s for expert ID: %s", gig.id, expert_id)
     else:
-        logger.info(f"No gig found for expert ID: {expert_id}")
+        logger.info("No gig found for expert ID: %s", expert_id)
     return gig
 
-def update_gig(db: Session, gig_id: str, gig_update: GigUpdate) -> Optional[Gig]:
-    """Updates an existing gig."""
-    logger.info(f"Updating gig with ID: {gig_id}")
-    logger.debug(f"Update data: {gig_update.dict(exclude_unset=True)}")
-    
-    db_gig = get_gig(db, gig_id)
-    if not db_gig:
-        logger.warning(f"Cannot update - gig with ID {gig_id} not found")
-        return None
-
+def _update_gig_where(db: Session, condition, gig_update: GigUpdate) -> Optional[Gig]:
+    """Applies a GigUpdate to the gig matching `condition` in one UPDATE ... RETURNING."""
     update_data = gig_update.dict(exclude_unset=True)
+    logger.debug("Update data: %s", update_data)
     
     # Handle category_id separately if provided
     if 'category_id' in update_data:
         category_id_or_slug = update_data.pop('category_id')
         if category_id_or_slug:
-            category = get_category(db, str(category_id_or_slug))
-            if category:
-                db_gig.category_id = category.id
+            category_id = resolve_category_id(db, str(category_id_or_slug))
+            if category_id:
+                update_data['category_id'] = category_id
             else:
-                logger.warning(f"Category with ID/slug {category_id_or_slug} not found, skipping category update")
-    
-    # Update other fields
-    for field, value in update_data.items():
-        setattr(db_gig, field, value)
+                logger.warning("Category with ID/slug %s not found, skipping category update", category_id_or_slug)
     
-    db_gig.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_gig)
-    logger.info(f"Gig ID: {gig_id} updated successfully")
+    # Single UPDATE ... RETURNING instead of SELECT, flush and refresh; updated_at is set by
+    # the column's onupdate=func.now(), and populate_existing refreshes any instance already loaded
+    db_gig = db.execute(
+        update(Gig)
+        .where(condition)
+        .values(**update_data)
+        .returning(Gig)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+    if db_gig:
+        db.commit()
+        _invalidate_gig_caches()
     return db_gig
 
-def update_gig_status(db: Session, gig_id: str, status_update) -> Optional[Gig]:
-    """Updates the status of a specific gig."""
-    logger.info(f"Updating status for gig ID: {gig_id} to {status_update.status}")
-    
-    db_gig = get_gig(db, gig_id)
+def update_gig(db: Session, gig_id: uuid.UUID, gig_update: GigUpdate) -> Optional[Gig]:
+    """Updates an existing gig."""
+    logger.info("Updating gig with ID: %s", gig_id)
+    db_gig = _update_gig_where(db, Gig.id == gig_id, gig_update)
     if not db_gig:
-        logger.warning(f"Cannot update status - gig with ID {gig_id} not found")
+        logger.warning("Cannot update - gig with ID %s not found", gig_id)
         return None
+    logger.info("Gig ID: %s updated successfully", gig_id)
+    return db_gig
+
+def update_gig_by_expert(db: Session, expert_id: str, gig_update: GigUpdate) -> Optional[Gig]:
+    """Updates an expert's gig, looked up by expert ID within the UPDATE itself."""
+    logger.info("Updating gig for expert ID: %s", expert_id)
+    db_gig = _update_gig_where(db, Gig.expert_id == expert_id, gig_update)
+    if not db_gig:
+        logger.warning("Cannot update - no gig found for expert ID %s", expert_id)
+        return None
+    logger.info("Gig ID: %s of expert ID: %s updated successfully", db_gig.id, expert_id)
+    return db_gig
+
+def update_gig_status(db: Session, gig_id: uuid.UUID, status_update) -> Optional[Gig]:
+    """Updates the status of a specific gig."""
+    logger.info("Updating status for gig ID: %s to %s", gig_id, status_update.status)
     
-    old_status = db_gig.status
-    db_gig.status = status_update.status
+    values = {"status": status_update.status}
     
     # If the gig is being approved, update the approved_at timestamp
     if status_update.status == GigStatus.ACTIVE:
-        logger.info(f"Gig ID: {gig_id} is being approved, updating approved_at timestamp")
-        db_gig.approved_at = datetime.utcnow()
+        logger.info("Gig ID: %s is being approved, updating approved_at timestamp", gig_id)
+        values["approved_at"] = func.now()
+    
+    # Issue the UPDATE directly and take the new row from RETURNING instead of reloading it
+    db_gig = db.execute(
+        update(Gig)
+        .where(Gig.id == gig_id)
+        .values(**values)
+        .returning(Gig)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+    if not db_gig:
+        logger.warning("Cannot update status - gig with ID %s not found", gig_id)
+        return None
         
     db.commit()
-    db.refresh(db_gig)
-    logger.info(f"Gig ID: {gig_id} status updated from {old_status} to {db_gig.status}")
+    _invalidate_gig_caches()
+    mark_gig_analytics_stale()
+    logger.info("Gig ID: %s status updated to %s", gig_id, status_update.status)
     return db_gig
 
-def update_gig_metrics(db: Session, gig_id: str, rating: Optional[float] = None, add_consultation: bool = False) -> Optional[Gig]:
-    """Updates the metrics for a gig (ratings, consultation count)."""
-    logger.info(f"Updating metrics for gig ID: {gig_id}")
+def update_gig_metrics(db: Session, gig_id: uuid.UUID, rating: Optional[float] = None, add_consultation: bool = False) -> Optional[Gig]:
+    """
+    Updates the metrics for a gig (ratings, consultation count).
+    Ratings and review totals are owned by the review service (see endpoints/analytics.py), so
+    gigs store no counters yet. When they do, update them with a single atomic
+    UPDATE ... SET n = n + 1 ... RETURNING rather than read-modify-write in Python.
+    """
+    logger.info("Updating metrics for gig ID: %s", gig_id)
     db_gig = get_gig(db, gig_id)
     if not db_gig:
-        logger.warning(f"Cannot update metrics - gig with ID {gig_id} not found")
+        logger.warning("Cannot update metrics - gig with ID %s not found", gig_id)
         return None
-    # Placeholder for future metrics logic
-    db.commit()
-    db.refresh(db_gig)
-    logger.info(f"Metrics updated for gig ID: {gig_id}")
+    # Placeholder for future metrics logic; nothing is written yet, so there is nothing to commit or reload
+    logger.info("Metrics updated for gig ID: %s", gig_id)
     return db_gig
 
-def delete_gig(db: Session, gig_id: str) -> bool:
+def _delete_gig_where(db: Session, condition) -> Optional[uuid.UUID]:
+    """Deletes the gig matching `condition` and returns its ID, or None if nothing matched."""
+    # Single DELETE ... RETURNING round trip, no SELECT or unit-of-work bookkeeping
+    deleted = db.execute(
+        delete(Gig).where(condition).returning(Gig.id, Gig.status)
+    ).one_or_none()
+    if deleted is None:
+        return None
+
+    db.commit()
+    _invalidate_gig_caches()
+    # Only active gigs are counted by the analytics view
+    if deleted.status == GigStatus.ACTIVE:
+        mark_gig_analytics_stale()
+    return deleted.id
+
+def delete_gig(db: Session, gig_id: uuid.UUID) -> bool:
     """Deletes a gig from the database."""
-    logger.info(f"Deleting gig with ID: {gig_id}")
-    db_gig = get_gig(db, gig_id)
-    if not db_gig:
-        logger.warning(f"Cannot delete - gig with ID {gig_id} not found")
+    logger.info("Deleting gig with ID: %s", gig_id)
+    if _delete_gig_where(db, Gig.id == gig_id) is None:
+        logger.warning("Cannot delete - gig with ID %s not found", gig_id)
         return False
-    db.delete(db_gig)
-    db.commit()
-    logger.info(f"Gig with ID: {gig_id} deleted successfully")
+    logger.info("Gig with ID: %s deleted successfully", gig_id)
     return True
 
-def get_gigs_filtered(
-    db: Session, filters: GigFilters, skip: int = 0, limit: int = 100
-) -> List[Gig]:
-    """Retrieves a list of gigs based on filter criteria."""
-    query = db.query(Gig).options(joinedload(Gig.category))
+def delete_gig_by_expert(db: Session, expert_id: str) -> Optional[uuid.UUID]:
+    """Deletes an expert's gig in a single statement. Returns the deleted gig's ID, or None if the expert has none."""
+    logger.info("Deleting gig for expert ID: %s", expert_id)
+    gig_id = _delete_gig_where(db, Gig.expert_id == expert_id)
+    if gig_id is None:
+        logger.warning("Cannot delete - no gig found for expert ID %s", expert_id)
+        return None
+    logger.info("Gig with ID: %s of expert ID: %s deleted successfully", gig_id, expert_id)
+    return gig_id
 
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _apply_gig_filters(db: Session, query, filters: GigFilters, empty_message: str):
+    """
+    Adds the WHERE clauses for the given gig filters to a query.
+    Returns None when the requested category does not exist (nothing can match).
+    """
     if filters.category_id:
         # Get category by ID or slug
-        category = get_category(db, filters.category_id)
-        if category:
-            query = query.filter(Gig.category_id == category.id)
+        category_id = resolve_category_id(db, filters.category_id)
+        if category_id:
+            query = query.filter(Gig.category_id == category_id)
         else:
-            # If category is not found, return empty list
-            logger.warning(f"Category with ID/slug {filters.category_id} not found, returning empty result")
-            return []
+            logger.warning("Category with ID/slug %s not found, %s", filters.category_id, empty_message)
+            return None
     
     if filters.min_rate is not None:
         query = query.filter(Gig.hourly_rate >= filters.min_rate)
@@ -248,114 +549,294 @@ def get_gigs_filtered(
         query = query.filter(Gig.experience_years >= filters.min_experience_years)
 
     if filters.search_query:
-        search_term = f"%{filters.search_query}%"
-        query = query.filter(Gig.service_description.ilike(search_term))
+        # Full-text match on the search vector, a substring match served by the trigram GIN index,
+        # or an exact expertise area served by the expertise_areas GIN index; the planner
+        # combines the three indexes with a BitmapOr instead of a sequential scan
+        query = query.filter(or_(
+            Gig.search_tsv.op('@@')(func.plainto_tsquery('english', filters.search_query)),
+            Gig.service_description.ilike(f"%{_escape_like(filters.search_query)}%", escape="\\"),
+            Gig.expertise_areas.op('&&')(cast([filters.search_query.strip()], ARRAY(String))),
+        ))
     
+    if filters.expertise_areas:
+        # Single ARRAY overlap (&&) predicate, served by the GIN index on expertise_areas
+        query = query.filter(Gig.expertise_areas.op('&&')(cast(filters.expertise_areas, ARRAY(String))))
+
     if filters.status:
         query = query.filter(Gig.status == filters.status)
+
+    return query
+
+def get_gigs_filtered(
+    db: Session, filters: GigFilters, skip: int = 0, limit: int = 100
+) -> List[Gig]:
+    """Retrieves a list of gigs based on filter criteria."""
+    query = db.query(Gig).options(*_GIG_LIST_OPTIONS)
+    query = _apply_gig_filters(db, query, filters, "returning empty result")
+    if query is None:
+        return []
     
-    logger.info(f"Filtering gigs with filters: {filters.dict() if hasattr(filters, 'dict') else filters}, skip={skip}, limit={limit}")
+    logger.info("Filtering gigs with filters: %s, skip=%d, limit=%d", filters, skip, limit)
     gigs = query.offset(skip).limit(limit).all()
-    logger.info(f"Filtered gigs count: {len(gigs)}")
+    logger.info("Filtered gigs count: %s", len(gigs))
     return gigs
 
-def get_gigs_count(db: Session, filters: GigFilters) -> int:
-    """Gets the total count of gigs that match the filter criteria."""
-    query = db.query(Gig)
+def _gig_count_cache_key(filters: GigFilters) -> tuple:
+    """Hashable key of the filter values for _gig_count_cache."""
+    return tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in filters.dict().items())
 
-    if filters.category_id:
-        # Get category by ID or slug
-        category = get_category(db, filters.category_id)
-        if category:
-            query = query.filter(Gig.category_id == category.id)
-        else:
-            # If category is not found, return 0
-            logger.warning(f"Category with ID/slug {filters.category_id} not found, count is 0")
-            return 0
-    
-    if filters.min_rate is not None:
-        query = query.filter(Gig.hourly_rate >= filters.min_rate)
-    
-    if filters.max_rate is not None:
-        query = query.filter(Gig.hourly_rate <= filters.max_rate)
-        
-    if filters.min_experience_years is not None:
-        query = query.filter(Gig.experience_years >= filters.min_experience_years)
+def get_gigs_filtered_with_total(
+    db: Session, filters: GigFilters, skip: int = 0, limit: int = 100
+) -> Tuple[List[Any], int]:
+    """
+    Retrieves a page of gigs matching the filters together with the total number of matches.
+    Each gig is a row of GIG_LIST_ITEM_COLUMNS rather than a Gig instance.
+    A total cached for these filters is reused, so the page query can stop at its LIMIT;
+    otherwise it comes from a COUNT(*) OVER () window on the same query (evaluating the
+    filters once) and is cached. Only a page past the end falls back to get_gigs_count.
+    Categories are not loaded; attach them with get_categories_for_gigs.
+    """
+    cache_key = _gig_count_cache_key(filters)
+    generation = gig_cache_generation()
+    cached_total = _gig_count_cache.get(cache_key)
+    if cached_total is not None:
+        query = db.query(*GIG_LIST_ITEM_COLUMNS)
+    else:
+        query = db.query(*GIG_LIST_ITEM_COLUMNS, func.count().over().label('total_count'))
+    query = _apply_gig_filters(db, query, filters, "returning empty result")
+    if query is None:
+        return [], 0
+
+    logger.info("Filtering gigs with total, filters: %s, skip=%d, limit=%d", filters, skip, limit)
+    # Newest first with id as tie-breaker (ix_gigs_created_at_id order), so pages are stable
+    rows = query.order_by(Gig.created_at.desc(), Gig.id.desc()).offset(skip).limit(limit).all()
+    if cached_total is not None:
+        logger.info("Filtered gigs count: %s of %s (cached total)", len(rows), cached_total)
+        return rows, cached_total
+    if not rows:
+        return [], get_gigs_count(db, filters)
+
+    total = rows[0].total_count
+    store_gig_cache_entry(_gig_count_cache, cache_key, total, generation)
+    logger.info("Filtered gigs count: %s of %s", len(rows), total)
+    return rows, total
 
-    if filters.search_query:
-        search_term = f"%{filters.search_query}%"
-        query = query.filter(Gig.service_description.ilike(search_term))
-    
-    if filters.status:
-        query = query.filter(Gig.status == filters.status)
+def get_gigs_count(db: Session, filters: GigFilters) -> int:
+    """Gets the total count of gigs that match the filter criteria."""
+    cache_key = _gig_count_cache_key(filters)
+    generation = gig_cache_generation()
+    cached_count = _gig_count_cache.get(cache_key)
+    if cached_count is not None:
+        return cached_count
+
+    query = _apply_gig_filters(db, db.query(Gig), filters, "count is 0")
+    if query is None:
+        return 0
         
     count = query.count()
-    logger.info(f"Counted {count} gigs matching filters: {filters.dict() if hasattr(filters, 'dict') else filters}")
+    store_gig_cache_entry(_gig_count_cache, cache_key, count, generation)
+    logger.info("Counted %d gigs matching filters: %s", count, filters)
     return count
 
-def get_pending_gigs(db: Session, skip: int = 0, limit: int = 100) -> List[Gig]:
-    """Get all gigs with pending status (awaiting admin approval)"""
-    logger.info(f"Retrieving pending gigs with skip={skip}, limit={limit}")
-    gigs = db.query(Gig).filter(Gig.status == GigStatus.PENDING).offset(skip).limit(limit).all()
-    logger.info(f"Found {len(gigs)} pending gigs")
+def encode_gig_cursor(gig: Gig) -> str:
+    """Encodes the keyset position (created_at, id) of a gig as an opaque page cursor."""
+    raw = f"{gig.created_at.isoformat()}|{gig.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_gig_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decodes a page cursor back into (created_at, id). Raises ValueError if it is malformed."""
+    try:
+        created_at, gig_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(gig_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def get_pending_gigs(
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[Tuple[datetime, uuid.UUID]] = None
+) -> List[Gig]:
+    """
+    Get all gigs with pending status (awaiting admin approval), newest first.
+    When `after` (a decoded cursor) is given, the page starts right after that gig
+    using keyset pagination and `skip` is ignored.
+    Categories are not loaded; attach them with get_categories_for_gigs.
+    """
+    logger.info("Retrieving pending gigs with skip=%s, limit=%s, after=%s", skip, limit, after)
+    if after:
+        gigs = db.execute(
+            _PENDING_GIGS_AFTER_STMT,
+            {'after_created_at': after[0], 'after_id': after[1], 'limit': limit}
+        ).scalars().all()
+    else:
+        gigs = db.execute(_PENDING_GIGS_STMT, {'skip': skip, 'limit': limit}).scalars().all()
+    logger.info("Found %s pending gigs", len(gigs))
     return gigs
 
-def get_all_gigs(db: Session, skip: int = 0, limit: int = 100) -> list[type[Gig]]:
-    """Retrieves all gigs with pagination, regardless of status.
+def get_gigs_by_status(db: Session, status: GigStatus, skip: int = 0, limit: int = 100) -> List[Gig]:
+    """
+    Get a page of gigs with the given status (admin review lists), newest first.
+    Categories are not loaded; attach them with get_categories_for_gigs.
+    """
+    logger.info("Retrieving %s gigs with skip=%s, limit=%s", status.value, skip, limit)
+    gigs = db.execute(_GIGS_BY_STATUS_STMT, {'status': status, 'skip': skip, 'limit': limit}).scalars().all()
+    logger.info("Found %s %s gigs", len(gigs), status.value)
+    return gigs
+
+def get_all_gigs(
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[Tuple[datetime, uuid.UUID]] = None
+) -> List[Gig]:
+    """Retrieves all gigs with pagination, regardless of status, newest first.
+
+    Categories are not loaded; attach them with get_categories_for_gigs.
 
     Args:
         db: Database session
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when `after` is given)
         limit: Maximum number of records to return
+        after: Decoded page cursor; the page starts right after this (created_at, id)
 
     Returns:
         List of Gig objects
     """
-    logger.info(f"Retrieving all gigs with skip={skip}, limit={limit}")
-    gigs = db.query(Gig).options(joinedload(Gig.category)).offset(skip).limit(limit).all()
-    logger.info(f"Retrieved {len(gigs)} gigs")
-    return gigs
+    logger.info("Retrieving all gigs with skip=%s, limit=%s, after=%s", skip, limit, after)
+    query = (db.query(Gig)
+             .options(*_GIG_LIST_ROW_OPTIONS)
+             .order_by(Gig.created_at.desc(), Gig.id.desc()))
+    if after:
+        # Keyset pagination: seek past the cursor instead of scanning and discarding `skip` rows
+        query = query.filter(tuple_(Gig.created_at, Gig.id) < tuple_(*after))
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
-def create_certification(db: Session, gig_id: str, url: str, thumbnail_url: Optional[str] = None) -> Any:
+def create_certification(db: Session, gig_id: uuid.UUID, url: str, thumbnail_url: Optional[str] = None) -> Any:
     """Creates a new certification record for a gig."""
-    logger.info(f"Creating certification for gig ID: {gig_id}")
-    
-    from .models import Certification
+    logger.info("Creating certification for gig ID: %s", gig_id)
     
-    db_cert = Certification(
-        gig_id=gig_id,
-        url=url,
-        thumbnail_url=thumbnail_url
-    )
-    db.add(db_cert)
+    db_cert = db.execute(
+        insert(Certification)
+        .values(gig_id=gig_id, url=url, thumbnail_url=thumbnail_url)
+        .returning(Certification)
+    ).scalar_one()
     db.commit()
-    db.refresh(db_cert)
-    logger.info(f"Certification created with ID: {db_cert.id}")
+    _invalidate_gig_detail(gig_id)
+    logger.info("Certification created with ID: %s", db_cert.id)
     return db_cert
 
 
-def get_certifications_by_gig(db: Session, gig_id: str) -> list:
+def create_certifications_bulk(
+    db: Session, gig_id: uuid.UUID, certifications: List[Tuple[str, Optional[str]]]
+) -> int:
+    """
+    Creates certification records for a gig from (url, thumbnail_url) pairs.
+    All rows go in one executemany INSERT and one commit (which also commits any
+    pending changes to the gig itself). Returns the number of records created.
+    """
+    if not certifications:
+        return 0
+    logger.info("Creating %s certifications for gig ID: %s", len(certifications), gig_id)
+    db.execute(
+        insert(Certification),
+        [{"gig_id": gig_id, "url": url, "thumbnail_url": thumbnail_url}
+         for url, thumbnail_url in certifications]
+    )
+    db.commit()
+    # The commit may carry changes to the gig row (e.g. its certification URLs)
+    _invalidate_gig_detail(gig_id)
+    return len(certifications)
+
+def delete_certification_by_url(db: Session, gig_id: uuid.UUID, url: str) -> bool:
+    """Deletes a gig's certification record by its URL and commits."""
+    logger.info("Deleting certification %s for gig ID: %s", url, gig_id)
+    result = db.execute(
+        delete(Certification)
+        .where(Certification.gig_id == gig_id, Certification.url == url)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    _invalidate_gig_detail(gig_id)
+    return result.rowcount > 0
+
+def get_certifications_by_gig(db: Session, gig_id: uuid.UUID) -> list:
     """Retrieves all certifications for a specific gig."""
-    logger.info(f"Retrieving certifications for gig ID: {gig_id}")
-    
-    from .models import Certification
+    logger.info("Retrieving certifications for gig ID: %s", gig_id)
     
-    certifications = db.query(Certification).filter(Certification.gig_id == gig_id).all()
-    logger.info(f"Retrieved {len(certifications)} certifications for gig {gig_id}")
+    certifications = db.execute(_CERTIFICATIONS_BY_GIG_STMT, {'gig_id': gig_id}).scalars().all()
+    logger.info("Retrieved %s certifications for gig %s", len(certifications), gig_id)
     return certifications
 
 
-def delete_certifications_by_gig(db: Session, gig_id: str) -> bool:
+def delete_certifications_by_gig(db: Session, gig_id: uuid.UUID) -> bool:
     """Deletes all certifications for a specific gig."""
-    logger.info(f"Deleting certifications for gig ID: {gig_id}")
-    
-    from .models import Certification
+    logger.info("Deleting certifications for gig ID: %s", gig_id)
     
-    result = db.query(Certification).filter(Certification.gig_id == gig_id).delete()
+    # One DELETE round trip; no session synchronization of the deleted rows
+    result = db.execute(
+        delete(Certification)
+        .where(Certification.gig_id == gig_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    _invalidate_gig_detail(gig_id)
+    logger.info("Deleted %s certifications for gig %s", result.rowcount, gig_id)
+    return result.rowcount > 0
+
+
+# gig_daily_active_counts is a materialized view holding the number of ACTIVE gigs per
+# creation day (see migration e6a1bcf2cf79); the dashboard reads these pre-aggregated rows
+# instead of scanning gigs, and it is the single source of the active gig totals. Status
+# changes and deletes of active gigs only mark it stale: the service lifespan refreshes it
+# out of band (refresh_gig_analytics_if_stale), so admin writes never wait on the recompute.
+# Starts stale so each process refreshes once after startup.
+_gig_analytics_stale = threading.Event()
+_gig_analytics_stale.set()
+_REFRESH_GIG_ANALYTICS_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY gig_daily_active_counts")
+
+# Gap-fills every day in [start, end] with generate_series and accumulates the
+# daily ACTIVE gig counts on top of the count that existed before the range.
+_DAILY_CUMULATIVE_GIGS_SQL = text("""
+    SELECT to_char(series.day, 'YYYY-MM-DD') AS date,
+           CAST(
+               (SELECT COALESCE(SUM(new_gigs), 0) FROM gig_daily_active_counts WHERE day < :start)
+               + SUM(COALESCE(daily.new_gigs, 0)) OVER (ORDER BY series.day)
+           AS INTEGER) AS count,
+           CAST((SELECT COALESCE(SUM(new_gigs), 0) FROM gig_daily_active_counts) AS INTEGER) AS total
+    FROM (
+        SELECT CAST(generate_series(CAST(:start AS DATE), CAST(:end AS DATE), INTERVAL '1 day') AS DATE) AS day
+    ) AS series
+    LEFT JOIN gig_daily_active_counts AS daily ON daily.day = series.day
+    ORDER BY series.day
+""")
+
+_TOTAL_ACTIVE_GIGS_SQL = text("SELECT CAST(COALESCE(SUM(new_gigs), 0) AS INTEGER) FROM gig_daily_active_counts")
+
+
+def mark_gig_analytics_stale() -> None:
+    """Flags the daily active gig counts for the next out-of-band refresh."""
+    _gig_analytics_stale.set()
+
+
+def refresh_gig_analytics(db: Session) -> None:
+    """Refreshes the pre-aggregated daily active gig counts used by the admin dashboard."""
+    logger.info("Refreshing gig analytics view")
+    db.execute(_REFRESH_GIG_ANALYTICS_SQL)
     db.commit()
-    logger.info(f"Deleted {result} certifications for gig {gig_id}")
-    return result > 0
+
+
+def refresh_gig_analytics_if_stale(db: Session) -> bool:
+    """
+    Refreshes the daily active gig counts if a write marked them stale since the last refresh.
+    Returns whether a refresh ran. Writes made during the refresh mark the view stale again.
+    """
+    if not _gig_analytics_stale.is_set():
+        return False
+    _gig_analytics_stale.clear()
+    try:
+        refresh_gig_analytics(db)
+    except Exception:
+        _gig_analytics_stale.set()
+        raise
+    return True
 
 
 def get_gig_analytics(db: Session, start_date: Optional[str] = None, end_date: Optional[str] = None):
@@ -363,72 +844,34 @@ def get_gig_analytics(db: Session, start_date: Optional[str] = None, end_date: O
     Get gig analytics data for admin dashboard.
     Returns daily gig counts within the specified date range.
     """
-    from sqlalchemy import func, extract
     from .schemas import GigAnalyticsResponse, DailyGigCount
     from datetime import datetime, timedelta
     
-    logger.info(f"Getting gig analytics for date range: {start_date} to {end_date}")
+    logger.info("Getting gig analytics for date range: %s to %s", start_date, end_date)
     
     try:
         # Parse dates
         if start_date:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            start_day = datetime.strptime(start_date, '%Y-%m-%d').date()
         else:
             # Default to 30 days ago
-            start_dt = datetime.now() - timedelta(days=30)
+            start_day = (datetime.now() - timedelta(days=30)).date()
         
         if end_date:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            end_day = datetime.strptime(end_date, '%Y-%m-%d').date()
         else:
             # Default to today
-            end_dt = datetime.now()
-        
-        # Query to get daily gig counts (only ACTIVE gigs) - optimized
-        query = db.query(
-            func.date(Gig.created_at).label('date'),
-            func.count(Gig.id).label('count')
-        ).filter(
-            Gig.created_at >= start_dt,
-            Gig.created_at <= end_dt,
-            Gig.status == 'active'  # Only count active gigs
-        ).group_by(
-            func.date(Gig.created_at)
-        ).order_by(
-            func.date(Gig.created_at)
-        )
-        
-        results = query.all()
-        
-        # Create a dictionary of existing data for easy lookup
-        data_dict = {result.date.strftime('%Y-%m-%d'): result.count for result in results}
-        
-        # Get cumulative count up to start_date (only ACTIVE gigs)
-        cumulative_base_count = db.query(Gig).filter(
-            Gig.created_at < start_dt,
-            Gig.status == 'active'  # Only count active gigs
-        ).count()
-        
-        # Generate all dates in the range and calculate cumulative counts
-        daily_counts = []
-        current_date = start_dt.date()
-        end_date_obj = end_dt.date()
-        cumulative_count = cumulative_base_count
+            end_day = datetime.now().date()
         
-        while current_date <= end_date_obj:
-            date_str = current_date.strftime('%Y-%m-%d')
-            daily_new_gigs = data_dict.get(date_str, 0)  # New active gigs on this date
-            cumulative_count += daily_new_gigs  # Add to cumulative total
-            
-            daily_counts.append(DailyGigCount(
-                date=date_str,
-                count=cumulative_count  # Use cumulative count of active gigs
-            ))
-            current_date += timedelta(days=1)
+        # Cumulative active gig count for every day in the range plus the overall total,
+        # read from the daily counts view in a single round trip
+        rows = db.execute(_DAILY_CUMULATIVE_GIGS_SQL, {"start": start_day, "end": end_day}).all()
+        daily_counts = [DailyGigCount(date=row.date, count=row.count) for row in rows]
         
-        # Get total count of ALL ACTIVE gigs ever created (single query)
-        total_count = db.query(Gig).filter(Gig.status == 'active').count()
+        # Total count of ALL ACTIVE gigs ever created; only an empty range needs its own query
+        total_count = rows[0].total if rows else db.execute(_TOTAL_ACTIVE_GIGS_SQL).scalar_one()
         
-        logger.info(f"Retrieved analytics: {len(daily_counts)} daily counts, total: {total_count}")
+        logger.info("Retrieved analytics: %s daily counts, total: %s", len(daily_counts), total_count)
         
         return GigAnalyticsResponse(
             data=daily_counts,
@@ -436,21 +879,42 @@ def get_gig_analytics(db: Session, start_date: Optional[str] = None, end_date: O
         )
         
     except Exception as e:
-        logger.error(f"Error in get_gig_analytics: {e}")
+        logger.error("Error in get_gig_analytics: %s", e)
         raise
 
 
 def get_total_active_gigs(db: Session) -> int:
     """
-    Get total count of active gigs.
+    Get total count of active gigs, from the same daily counts view as the dashboard
+    analytics so both report the same total.
     """
     logger.info("Getting total count of active gigs")
     
     try:
-        total_count = db.query(Gig).filter(Gig.status == 'active').count()
-        logger.info(f"Total active gigs: {total_count}")
+        total_count = db.execute(_TOTAL_ACTIVE_GIGS_SQL).scalar_one()
+        logger.info("Total active gigs: %s", total_count)
         return total_count
         
     except Exception as e:
-        logger.error(f"Error getting total active gigs: {e}")
+        logger.error("Error getting total active gigs: %s", e)
+        raise
+
+
+def get_gig_status_counts(db: Session) -> dict:
+    """
+    Get the number of gigs in each status with a single GROUP BY query.
+    Statuses without any gigs are reported as 0.
+    """
+    logger.info("Getting gig counts by status")
+
+    try:
+        counts = {status: 0 for status in GigStatus}
+        for status, count in db.execute(select(Gig.status, func.count()).group_by(Gig.status)):
+            if status is not None:
+                counts[status] = count
+        logger.info("Gig status counts: %s", counts)
+        return counts
+
+    except Exception as e:
+        logger.error("Error getting gig status counts: %s", e)
         raise
@@ -1,7 +1,8 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, Float, DateTime, func, Text, Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
+from sqlalchemy.orm import relationship, deferred, validates
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, func, Text, ForeignKey, Computed, Index, text
+from sqlalchemy.types import TypeDecorator
 import uuid
 import enum
 
@@ -13,6 +14,44 @@ class GigStatus(str, enum.Enum):
     HOLD = "hold"
     REJECTED = "rejected"
 
+# Stored SMALLINT code for each status. Codes are persisted, so never renumber them;
+# the partial indexes and the gig_daily_active_counts view filter on these literals.
+GIG_STATUS_CODES = {
+    GigStatus.PENDING: 0,
+    GigStatus.ACTIVE: 1,
+    GigStatus.HOLD: 2,
+    GigStatus.REJECTED: 3,
+}
+_GIG_STATUS_BY_CODE = {code: status for status, code in GIG_STATUS_CODES.items()}
+
+
+def coerce_gig_status(value):
+    """Accepts a GigStatus, its stored code, or its value/name ("active"/"ACTIVE")."""
+    if value is None or isinstance(value, GigStatus):
+        return value
+    if isinstance(value, int):
+        return _GIG_STATUS_BY_CODE[value]
+    try:
+        return GigStatus(value)
+    except ValueError:
+        return GigStatus[value]
+
+
+class GigStatusType(TypeDecorator):
+    """
+    Stores GigStatus as a 2-byte SMALLINT code instead of a Postgres enum, keeping the
+    status indexes narrow; Python code and API responses still see GigStatus members.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        status = coerce_gig_status(value)
+        return None if status is None else GIG_STATUS_CODES[status]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else _GIG_STATUS_BY_CODE[value]
+
 class Category(Base):
     """
     Stores the main service categories for organizing gigs.
@@ -44,26 +83,47 @@ class Certification(Base):
     id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
     )
-    gig_id = Column(String, index=True)  # Foreign key to Gig
-    url = Column(String, nullable=False)  # URL to the stored certification document
-    thumbnail_url = Column(String, nullable=True)  # URL to the thumbnail image
+    # Certifications go with their gig: Postgres deletes them when the gig row is deleted
+    gig_id = Column(UUID(as_uuid=True), ForeignKey("gigs.id", ondelete="CASCADE"), nullable=False, index=True)
+    url = Column(String(2000), nullable=False)  # URL to the stored certification document
+    thumbnail_url = Column(String(2000), nullable=True)  # URL to the thumbnail image
     uploaded_at = Column(DateTime, server_default=func.now())
+    gig = relationship("Gig", back_populates="certifications")
 
     def __repr__(self):
         return f"<Certification(id={self.id}, gig_id='{self.gig_id}', url='{self.url}', thumbnail_url='{self.thumbnail_url}')>"
 
 class Gig(Base):
     __tablename__ = 'gigs'
+    __table_args__ = (
+        Index("ix_gigs_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index("ix_gigs_expertise_areas", "expertise_areas", postgresql_using="gin"),
+        # pg_trgm index so substring (ILIKE '%q%') searches avoid a sequential scan
+        Index("ix_gigs_search_trgm", "service_description", postgresql_using="gin",
+              postgresql_ops={"service_description": "gin_trgm_ops"}),
+        # Matches the status/category/rate predicates of the public gig listing
+        Index("ix_gigs_status_category_rate", "status", "category_id", "hourly_rate"),
+        # Admin review queue only ever reads pending gigs, paged by the (created_at, id) keyset
+        Index("ix_gigs_pending_created_at", text("created_at DESC"), text("id DESC"),
+              postgresql_where=text("status = 0")),
+        # Active-gig counts and the daily analytics aggregate only ever read active gigs
+        Index("ix_gigs_active_created_at", "created_at", postgresql_where=text("status = 1")),
+        # Keyset pagination order for the admin/all gig listings
+        Index("ix_gigs_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
     
-    id = Column(String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    expert_id = Column(String, index=True)  # Firebase UID from User Service
-    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False)  # Foreign key to Category
+    # Server-generated values (updated_at) come back via RETURNING on flush instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    expert_id = Column(String(128), unique=True, index=True)  # Firebase UID from User Service; one gig per expert
+    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False, index=True)  # Foreign key to Category
     service_description = Column(Text)
     hourly_rate = Column(Float, nullable=False)
-    currency = Column(String, default='LKR')
+    currency = Column(String(3), default='LKR')  # ISO 4217 code
     availability_preferences = Column(Text)
-    response_time = Column(String, default='< 24 hours')
-    thumbnail_url = Column(String, nullable=True)
+    response_time = Column(String(32), default='< 24 hours')
+    thumbnail_url = Column(String(2000), nullable=True)
     
     # Qualifications (from ApplyExpert step 2)
     expertise_areas = Column(ARRAY(String))  # List of expertise areas
@@ -72,15 +132,37 @@ class Gig(Base):
     certification = Column(ARRAY(String))  # List of certification URLs
     
     # System fields
-    status = Column(Enum(GigStatus, name="gigstatus"), default=GigStatus.PENDING)
+    status = Column(GigStatusType(), default=GigStatus.PENDING)
+
+    # Full-text search vector maintained by Postgres (GIN indexed); deferred so it is never loaded into rows
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(service_description, '') || ' ' || coalesce(work_experience, ''))",
+                 persisted=True)
+    ))
 
     # Relationships
-    category = relationship("Category", back_populates="gigs")
+    # Every gig response nests its category; "selectin" batches any load not covered by an
+    # explicit loader option into one IN (...) query instead of one SELECT per gig
+    category = relationship("Category", back_populates="gigs", lazy="selectin")
+    # passive_deletes leaves removing a deleted gig's certifications to the ON DELETE CASCADE
+    certifications = relationship(
+        "Certification",
+        back_populates="gig",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Certification.uploaded_at",
+    )
     
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     approved_at = Column(DateTime, nullable=True)
     
+    @validates("status")
+    def _validate_status(self, key, value):
+        """Normalizes assigned statuses (enum, stored code or string) to a GigStatus member."""
+        return coerce_gig_status(value)
+
     def __repr__(self):
         return f"<Gig(id={self.id}, expert_id={self.expert_id}, service_description='{self.service_description}', hourly_rate={self.hourly_rate})>"
\ No newline at end of file
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 import uuid
-from pydantic import BaseModel, Field, UUID4
+from pydantic import BaseModel, ConfigDict, Field, UUID4, field_validator, TypeAdapter
 import enum
 from fastapi import Form
 from app.db.models import GigStatus
@@ -13,7 +13,11 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 class UserDTO(BaseModel):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    """
+    Read-only view of a user owned by the user service. Every instance is built from existing
+    user data, so id and timestamps are required rather than generated per instance.
+    """
+    id: uuid.UUID
     firebase_uid: str
     name: str
     email: str
@@ -22,15 +26,11 @@ class UserDTO(BaseModel):
     bio: Optional[str] = None
     profile_image_url: Optional[str] = None
     location: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime
+    updated_at: datetime
     is_expert: bool = True
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            uuid.UUID: str
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 class CategoryBase(BaseModel):
     """Base schema for category data."""
@@ -51,8 +51,21 @@ class Category(CategoryBase):
     id: UUID4
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import: serializes the category listing to JSON in a single call
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[Category])
+
+
+def normalize_expertise_areas(areas: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Strips whitespace, drops blanks and removes duplicates (keeping order), so stored
+    areas and filter values compare exactly in the GIN-indexed array overlap.
+    """
+    if areas is None:
+        return None
+    return list(dict.fromkeys(area.strip() for area in areas if area and area.strip()))
 
 
 class GigBase(BaseModel):
@@ -63,6 +76,8 @@ class GigBase(BaseModel):
     work_experience: Optional[str] = Field(None, max_length=2000)
     thumbnail_url: Optional[str] = Field(None, max_length=2000)
 
+    _normalize_expertise_areas = field_validator("expertise_areas")(normalize_expertise_areas)
+
 
 class GigCreate(GigBase):
     category_id: str = Field(..., description="The ID or slug of the category")
@@ -72,18 +87,16 @@ class GigCreate(GigBase):
 def gig_create_form(
     service_description: Optional[str] = Form(None),
     hourly_rate: float = Form(...),
-    expertise_areas: Optional[str] = Form(None),   # You’ll need to handle conversion
+    expertise_areas: List[str] = Form([]),   # Repeated form field, one value per area
     experience_years: Optional[int] = Form(None),
     work_experience: Optional[str] = Form(None),
     thumbnail_url: Optional[str] = Form(None),
     category_id: str = Form(...)
 ) -> GigCreate:
-    # Convert comma-separated string into list for expertise_areas
-    expertise_list = expertise_areas.split(",") if expertise_areas else []
     return GigCreate(
         service_description=service_description,
         hourly_rate=hourly_rate,
-        expertise_areas=expertise_list,
+        expertise_areas=expertise_areas,
         experience_years=experience_years,
         work_experience=work_experience,
         thumbnail_url=thumbnail_url,
@@ -101,6 +114,8 @@ class GigUpdate(BaseModel):
     experience_years: Optional[int] = Field(None, ge=0)
     work_experience: Optional[str] = Field(None, max_length=2000)  # New field for work experience details
 
+    _normalize_expertise_areas = field_validator("expertise_areas")(normalize_expertise_areas)
+
 
 class Gig(GigBase):
     """
@@ -108,7 +123,7 @@ class Gig(GigBase):
     Includes all database fields and nested category information.
     """
 
-    id: str
+    id: UUID4
     expert_id: str
     category: Category  # Nest the full category object for rich responses
     status: GigStatus
@@ -118,8 +133,25 @@ class Gig(GigBase):
     updated_at: Optional[datetime]
     approved_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, gig, category: Optional[Category] = None) -> "Gig":
+        """
+        Builds the schema from a trusted, already loaded ORM gig with model_construct,
+        skipping field validation (the database already enforces the types).
+        Used for list responses, where per-object validation dominates response assembly.
+        Pass `category` (e.g. a cached snapshot) to avoid touching the gig's relationship.
+        """
+        data = {name: getattr(gig, name) for name in cls.model_fields if name != 'category'}
+        data['category'] = category if category is not None else Category.model_construct(
+            **{name: getattr(gig.category, name) for name in Category.model_fields}
+        )
+        return cls.model_construct(**data)
+
+
+# Built once at import: serializes a whole list of gigs to JSON in a single call
+GIG_LIST_ADAPTER = TypeAdapter(List[Gig])
 
 
 class GigResponse(Gig):
@@ -127,10 +159,30 @@ class GigResponse(Gig):
     pass
 
 
+class GigListItem(BaseModel):
+    """
+    A gig as shown on category/search result cards. Leaves out work_experience and the
+    update/approval timestamps, which only the detail and dashboard views display.
+    """
+
+    id: UUID4
+    expert_id: str
+    category: Category
+    service_description: Optional[str] = None
+    hourly_rate: float
+    currency: str
+    response_time: str
+    thumbnail_url: Optional[str] = None
+    expertise_areas: List[str] = []
+    experience_years: Optional[int] = None
+    status: GigStatus
+    created_at: datetime
+
+
 class GigListResponse(BaseModel):
     """Response model for a paginated list of gigs."""
 
-    gigs: List[Gig]
+    gigs: List[GigListItem]
     total: int
     page: int
     size: int
@@ -161,8 +213,11 @@ class GigFilters(BaseModel):
     max_rate: Optional[float] = Field(None, ge=0)
     min_experience_years: Optional[int] = Field(None, ge=0)
     search_query: Optional[str] = Field(None, max_length=100)
+    expertise_areas: Optional[List[str]] = None  # Matches gigs having any of these areas
     status: Optional[GigStatus] = Field(default=GigStatus.ACTIVE)
 
+    _normalize_expertise_areas = field_validator("expertise_areas")(normalize_expertise_areas)
+
 
 class GigStatusUpdate(BaseModel):
     """Schema for updating a gig's status by admins."""
@@ -3,13 +3,17 @@ Analytics endpoints for gig performance metrics from review service.
 Provides rating, review count, and performance data.
 """
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.db.session import get_db
+from sqlalchemy import func, select
+from app.db.session import get_read_db
 from app.db.models import Gig
+from app.utils.cache import LockedTTLCache
+import asyncio
 import httpx
 import logging
 import os
+import uuid
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -17,11 +21,56 @@ router = APIRouter()
 # Review service URL
 REVIEW_SERVICE_URL = os.getenv("REVIEW_SERVICE_URL", "http://localhost:8004")
 
+# Shared keep-alive client for review-service calls; closed on application shutdown
+review_service_client = httpx.AsyncClient(
+    base_url=REVIEW_SERVICE_URL,
+    timeout=5.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+# gig ID -> (average rating, total reviews). Review aggregates move slowly, so fresh stats are
+# reused for 30s; the last known stats are kept longer and served when the review service fails.
+_review_stats_cache = LockedTTLCache(maxsize=5000, ttl=30)
+# gig ID -> (last known stats, their ETag from the review service, or None)
+_last_review_stats = LockedTTLCache(maxsize=5000, ttl=3600)
+
+
+async def _get_review_stats(gig_id: uuid.UUID) -> tuple:
+    """Returns (average rating, total reviews) for a gig from the review service, via the caches."""
+    review_stats = _review_stats_cache.get(gig_id)
+    if review_stats is not None:
+        return review_stats
+    last_stats, etag = _last_review_stats.get(gig_id, ((0, 0), None))
+    try:
+        # Revalidate the last known stats: the review service answers 304 without a body if unchanged
+        review_response = await review_service_client.get(
+            f"/reviews/gig/{gig_id}/stats",
+            headers={"If-None-Match": etag} if etag else None,
+        )
+
+        if review_response.status_code == 304:
+            _review_stats_cache[gig_id] = last_stats
+            _last_review_stats[gig_id] = (last_stats, etag)
+            return last_stats
+        if review_response.status_code == 200:
+            review_data = review_response.json()
+            review_stats = (review_data.get("average_rating", 0), review_data.get("total_reviews", 0))
+            _review_stats_cache[gig_id] = review_stats
+            _last_review_stats[gig_id] = (review_stats, review_response.headers.get("ETag"))
+            return review_stats
+        logger.warning("Review service returned %s for gig %s", review_response.status_code, gig_id)
+
+    except httpx.RequestError as e:
+        logger.error("Error connecting to review service: %s", e)
+
+    # Serve the last known stats, or fallback values if the review service is unavailable
+    return last_stats
+
 
 @router.get("/{gig_id}/performance")
 async def get_gig_performance(
-    gig_id: str,
-    db: Session = Depends(get_db)
+    gig_id: uuid.UUID,
+    db: Session = Depends(get_read_db)
 ):
     """
     Get performance metrics for a specific gig.
@@ -33,33 +82,16 @@ async def get_gig_performance(
     - Repeat customer estimation (placeholder)
     """
     try:
-        # Get gig details
-        gig = db.query(Gig).filter(Gig.id == gig_id).first()
+        # Only the response time is needed from the gig row (ratings live in the review service).
+        # The sync Session runs in the threadpool while the review stats are fetched concurrently.
+        gig_result, review_stats = await asyncio.gather(
+            run_in_threadpool(db.execute, select(Gig.response_time).where(Gig.id == gig_id)),
+            _get_review_stats(gig_id),
+        )
+        gig = gig_result.first()
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
-        
-        # Fetch reviews from review service
-        try:
-            async with httpx.AsyncClient() as client:
-                review_response = await client.get(
-                    f"{REVIEW_SERVICE_URL}/reviews/gig/{gig_id}/stats",
-                    timeout=5.0
-                )
-                
-                if review_response.status_code == 200:
-                    review_data = review_response.json()
-                    avg_rating = review_data.get("average_rating", 0)
-                    total_reviews = review_data.get("total_reviews", 0)
-                else:
-                    logger.warning(f"Review service returned {review_response.status_code} for gig {gig_id}")
-                    avg_rating = 0
-                    total_reviews = 0
-                    
-        except httpx.RequestError as e:
-            logger.error(f"Error connecting to review service: {str(e)}")
-            # Use fallback values if review service is unavailable
-            avg_rating = 0
-            total_reviews = 0
+        avg_rating, total_reviews = review_stats
         
         # Return performance metrics
         return {
@@ -71,6 +103,8 @@ async def get_gig_performance(
             "avgSessionDuration": "45 min"  # Placeholder - would need booking service data
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching performance for gig {gig_id}: {str(e)}")
+        logger.error("Error fetching performance for gig %s: %s", gig_id, e)
         raise HTTPException(status_code=500, detail=f"Error fetching performance: {str(e)}")
@@ -1,11 +1,18 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from app.db import schemas
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from app.utils.cache import LockedTTLCache
 from app.db import crud, session
+from app.utils.logger import get_logger
 
 router = APIRouter()
+logger = get_logger(__name__)
+
+# Rendered JSON of the category listing, loaded on nearly every page. Categories only change
+# through create_category below, which drops it.
+_categories_body_cache = LockedTTLCache(maxsize=1, ttl=600)
 
 # create category
 @router.post("/", response_model=schemas.Category, status_code=status.HTTP_201_CREATED)
@@ -18,19 +25,22 @@ def create_category(
     """
     try:
         db_category = crud.create_category(db=db, category=category)
+        _categories_body_cache.clear()
         return db_category
     except Exception as e:
-        print(f"Error in create_category: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in create_category: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create category: {str(e)}")
     
 
 # get all categories
 @router.get("/categories", response_model=List[schemas.Category])
-def get_all_categories(db: Session = Depends(session.get_db)):
+def get_all_categories(db: Session = Depends(session.get_read_db)):
     """
     Get all categories.
     """
-    categories = crud.get_all_categories(db=db)
-    return categories   
\ No newline at end of file
+    body = _categories_body_cache.get('all')
+    if body is None:
+        categories = crud.get_all_categories(db=db)
+        body = schemas.CATEGORY_LIST_ADAPTER.dump_json(categories)
+        _categories_body_cache['all'] = body
+    return Response(content=body, media_type="application/json")   
\ No newline at end of file
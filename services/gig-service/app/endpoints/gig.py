@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query, File, UploadFile, Form, Body
+from fastapi import APIRouter, Depends, status, HTTPException, Query, File, UploadFile, Form, Body, Response
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from app.db import schemas
 from sqlalchemy.orm import Session
-from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
 import json
+import uuid
 
 from typing import List, Optional
 from app.db import crud, session
@@ -15,6 +18,21 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _decode_cursor_or_400(cursor: Optional[str]):
+    """Decodes an optional keyset page cursor, rejecting malformed ones with a 400."""
+    if not cursor:
+        return None
+    try:
+        return crud.decode_gig_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _gig_list_response(gigs: List[schemas.Gig], headers: Optional[dict] = None) -> Response:
+    """Serializes a page of gig schemas in one pass with the prebuilt list adapter."""
+    return Response(content=schemas.GIG_LIST_ADAPTER.dump_json(gigs), media_type="application/json", headers=headers)
+
+
 @router.post("/", response_model=schemas.Gig, status_code=status.HTTP_201_CREATED)
 async def create_new_gig(
     gig: schemas.GigCreate = Depends(schemas.gig_create_form),
@@ -29,21 +47,16 @@ async def create_new_gig(
     - certificate_files: List of certificate files to upload
     """
     try:
-        logger.info(f"Creating new gig for expert: {current_user_id}")
-        logger.debug(f"Gig data received: {jsonable_encoder(gig)}")
+        logger.info("Creating new gig for expert: %s", current_user_id)
+        logger.debug("Gig data received: %s", gig)
         
         # Convert UUID to string if needed
         expert_id = str(current_user_id)
         
-        # Check if category exists before creating gig
-        category = crud.get_category(db, str(gig.category_id))
-        if not category:
-            logger.warning(f"Category with ID {gig.category_id} not found when creating gig for user {expert_id}")
-            raise HTTPException(status_code=404, detail=f"Category with ID {gig.category_id} not found")
-        
-        # Create gig first to get ID (we'll need it for the certificate files)
-        db_gig = crud.create_gig(db=db, gig=gig, expert_id=expert_id)
-        logger.info(f"Gig created initially with ID: {db_gig.id}")
+        # Create gig first to get ID (we'll need it for the certificate files);
+        # crud.create_gig raises ValueError for an unknown category
+        db_gig = await run_in_threadpool(crud.create_gig, db=db, gig=gig, expert_id=expert_id)
+        logger.info("Gig created initially with ID: %s", db_gig.id)
         
         # Handle certificate files if any were uploaded
         certificate_paths = []
@@ -51,157 +64,190 @@ async def create_new_gig(
             try:
                 # Save the certificate files and get their paths
                 certificate_paths = await save_certificate_files(certificate_files, db_gig.id)
-                logger.info(f"Saved {len(certificate_paths)} certificate files for gig {db_gig.id}")
+                logger.info("Saved %s certificate files for gig %s", len(certificate_paths), db_gig.id)
                 
                 # Update the gig with the certificate paths if any were saved
                 if certificate_paths:
-                    # Update the gig's certification field with the file paths
+                    # Update the gig's certification field with the file paths and record
+                    # every certificate in one bulk INSERT (committed together)
                     db_gig.certification = certificate_paths
-                    db.commit()
-                    logger.info(f"Updated gig {db_gig.id} with certificate paths")
+                    await run_in_threadpool(
+                        crud.create_certifications_bulk, db=db, gig_id=db_gig.id,
+                        certifications=[(path, None) for path in certificate_paths]
+                    )
+                    logger.info("Updated gig %s with certificate paths", db_gig.id)
             except Exception as e:
-                logger.error(f"Error saving certificate files: {str(e)}")
+                logger.error("Error saving certificate files: %s", e)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to upload certificate files",
                 ) from e
         
-        # We need to fetch the complete gig with relationship data for the response
-        # Because the crud.create_gig doesn't populate the relationship
-        complete_gig = crud.get_gig(db=db, gig_id=db_gig.id)
-        logger.info(f"Gig creation completed: {db_gig.id}")
-        return complete_gig
+        # The INSERT ... RETURNING row already holds every gig column; only the category is
+        # missing, and it comes from the in-process category cache instead of a re-SELECT
+        categories = await run_in_threadpool(crud.get_categories_for_gigs, db=db, gigs=[db_gig])
+        logger.info("Gig creation completed: %s", db_gig.id)
+        return schemas.Gig.from_orm_fast(db_gig, categories[db_gig.category_id])
 
     except HTTPException:
         # Re-raise HTTP exceptions without modification
         raise
+    except IntegrityError:
+        # gigs.expert_id is unique: an expert can only have one gig
+        db.rollback()
+        logger.warning("Expert %s already has a gig", current_user_id)
+        raise HTTPException(status_code=409, detail="Expert already has a gig")
     except ValueError as e:
-        logger.error(f"Validation error in create_new_gig for user {current_user_id}: {e}")
+        logger.error("Validation error in create_new_gig for user %s: %s", current_user_id, e)
         raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error in create_new_gig for user {current_user_id}: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error in create_new_gig for user %s: %s", current_user_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to create gig: {str(e)}")
 
 
 @router.get("/public", response_model=schemas.GigListResponse)
-def get_public_gigs(
+async def get_public_gigs(
         category_id: Optional[str] = Query(None),  # Added Optional
         min_rate: Optional[float] = Query(None, ge=0),
         max_rate: Optional[float] = Query(None, ge=0),
         search_query: Optional[str] = Query(None, max_length=100),
         min_experience_years: Optional[int] = Query(None, ge=0),
+        expertise_areas: Optional[List[str]] = Query(None),
         page: int = Query(1, ge=1),
         size: int = Query(10, ge=1, le=100),
-        db: Session = Depends(session.get_db)
+        db: Session = Depends(session.get_read_db)
 ):
     """
     Get public gigs for category/search pages.
     This feeds the Category.tsx component.
-    """
-    logger.info(f"Fetching public gigs: category_id={category_id}, min_rate={min_rate}, max_rate={max_rate}, search_query={search_query}, min_experience_years={min_experience_years}, page={page}, size={size}")
+    Cached pages are served on the event loop; only cache misses query in the threadpool.
+    """
+    logger.info("Fetching public gigs: category_id=%s, min_rate=%s, max_rate=%s, search_query=%s, min_experience_years=%s, expertise_areas=%s, page=%s, size=%s", category_id, min_rate, max_rate, search_query, min_experience_years, expertise_areas, page, size)
+    cache_key = (category_id, min_rate, max_rate, search_query, min_experience_years,
+                 tuple(expertise_areas or ()), page, size)
+    body = crud.public_gig_page_cache.get(cache_key)
+    if body is not None:
+        logger.info("Public gigs page served from cache")
+        return Response(content=body, media_type="application/json")
+    # Noted before querying: a gig write committed meanwhile makes the rendered page unsafe to cache
+    generation = crud.gig_cache_generation()
+
     filters = schemas.GigFilters(
         category_id=category_id,
         min_rate=min_rate,
         max_rate=max_rate,
         search_query=search_query,
         status=schemas.GigStatus.ACTIVE,  # Only show active gigs
-        min_experience_years=min_experience_years
+        min_experience_years=min_experience_years,
+        expertise_areas=expertise_areas
     )
 
     skip = (page - 1) * size
-    gigs = crud.get_gigs_filtered(db=db, filters=filters, skip=skip, limit=size)
-    total = crud.get_gigs_count(db=db, filters=filters)
+    # Page and total come back from one query (COUNT(*) OVER ())
+    gigs, total = await run_in_threadpool(
+        crud.get_gigs_filtered_with_total, db=db, filters=filters, skip=skip, limit=size
+    )
     pages = (total + size - 1) // size
-    logger.info(f"Public gigs fetched: count={len(gigs)}, total={total}, pages={pages}")
-    return schemas.GigListResponse(
-        gigs=gigs,
+    logger.info("Public gigs fetched: count=%s, total=%s, pages=%s", len(gigs), total, pages)
+    # Categories come from the in-process cache rather than a per-page query
+    categories = await run_in_threadpool(crud.get_categories_for_gigs, db=db, gigs=gigs)
+    # Rows come straight from the database, so the response is built without re-validation
+    # and serialized by orjson directly (response_model only documents the shape)
+    response = ORJSONResponse(content=schemas.GigListResponse.model_construct(
+        gigs=[schemas.GigListItem.model_construct(**gig._mapping, category=categories[gig.category_id])
+              for gig in gigs],
         total=total,
         page=page,
         size=size,
         pages=pages  # Added missing pages field
-    )
+    ).model_dump())
+    crud.store_gig_cache_entry(crud.public_gig_page_cache, cache_key, response.body, generation)
+    return response
 
 
 @router.get("/{gig_id}", response_model=schemas.GigDetailResponse)
-def get_gig_detail(
-        gig_id: str,
-        db: Session = Depends(session.get_db)
+async def get_gig_detail(
+        gig_id: uuid.UUID,
+        db: Session = Depends(session.get_read_db)
 ):
     """
     Get a gig by ID.
+    Cached details are served on the event loop; only cache misses query in the threadpool.
     """
-    logger.info(f"Fetching gig details for gig ID: {gig_id}")
-    db_gig = crud.get_gig(db=db, gig_id=gig_id)
+    logger.info("Fetching gig details for gig ID: %s", gig_id)
+    body = crud.gig_detail_cache.get(gig_id)
+    if body is not None:
+        logger.info("Gig details for gig ID: %s served from cache", gig_id)
+        return Response(content=body, media_type="application/json")
+    generation = crud.gig_cache_generation()
+
+    db_gig = await run_in_threadpool(crud.get_gig, db=db, gig_id=gig_id)
     if not db_gig:
-        logger.warning(f"Gig not found for gig ID: {gig_id}")
+        logger.warning("Gig not found for gig ID: %s", gig_id)
         raise HTTPException(status_code=404, detail="Gig not found")
 
     # Only show active gigs to public
     if db_gig.status not in [schemas.GigStatus.ACTIVE]:
-        logger.warning(f"Gig with ID {gig_id} is not available (status: {db_gig.status})")
+        logger.warning("Gig with ID %s is not available (status: %s)", gig_id, db_gig.status)
         raise HTTPException(status_code=404, detail="Gig not available")
 
-    logger.info(f"Gig details returned for gig ID: {gig_id}")
-    return db_gig
+    logger.info("Gig details returned for gig ID: %s", gig_id)
+    response = ORJSONResponse(content=schemas.GigDetailResponse.from_orm_fast(db_gig).model_dump())
+    crud.store_gig_cache_entry(crud.gig_detail_cache, gig_id, response.body, generation)
+    return response
 
 
 @router.get("/", response_model=List[schemas.Gig])  # Fixed response model
 def get_all_gigs(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db)
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        db: Session = Depends(session.get_read_db)
 ):
     """
-    Get all gigs with pagination.
+    Get all gigs with pagination, newest first.
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next page
+    without an OFFSET scan.
     """
-    logger.info(f"Fetching all gigs with skip={skip}, limit={limit}")
-    gigs = crud.get_all_gigs(db=db, skip=skip, limit=limit)
-
-    def enrich_gig(gig):
-        gig_dict = gig.__dict__.copy() if hasattr(gig, '__dict__') else dict(gig)
-        gig_dict["bio"] = "Experienced expert in the field. Contact for more info."
-        gig_dict["banner_image_url"] = "/logo.png"
-        gig_dict["profile_image_url"] = "/favicon.png"
-        gig_dict["name"] = "Expert Name"
-        gig_dict["title"] = "Professional Consultant"
-        gig_dict["rating"] = "4.8"
-        gig_dict["total_reviews"] = "12"
-        gig_dict["total_consultations"] = "25"
-        return gig_dict
+    logger.info("Fetching all gigs with skip=%s, limit=%s, cursor=%s", skip, limit, cursor)
+    after = _decode_cursor_or_400(cursor)
+    rows = crud.get_all_gigs(db=db, skip=skip, limit=limit, after=after)
+    categories = crud.get_categories_for_gigs(db=db, gigs=rows)
+    gigs = [schemas.Gig.from_orm_fast(gig, categories[gig.category_id]) for gig in rows]
 
-    enriched_gigs = [enrich_gig(g) for g in gigs]
-    logger.info(f"All gigs fetched: count={len(enriched_gigs)}")
-    return enriched_gigs
+    headers = {}
+    if gigs and len(gigs) == limit:
+        headers["X-Next-Cursor"] = crud.encode_gig_cursor(gigs[-1])
+    logger.info("All gigs fetched: count=%s", len(gigs))
+    return _gig_list_response(gigs, headers)
 
 
 @router.get("/expert/{expert_id}", response_model=schemas.Gig)  # New endpoint for expert gigs
 def get_gig_by_expert(
         expert_id: str,
-        db: Session = Depends(session.get_db)
+        db: Session = Depends(session.get_read_db)
 ):
     """
     Get gig by expert Firebase UID.
     Used for expert profile lookups.
     """
-    logger.info(f"Fetching gig for expert ID: {expert_id}")
+    logger.info("Fetching gig for expert ID: %s", expert_id)
     db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
     if not db_gig:
-        logger.warning(f"Expert gig not found for expert ID: {expert_id}")
+        logger.warning("Expert gig not found for expert ID: %s", expert_id)
         raise HTTPException(status_code=404, detail="Expert gig not found")
 
     if db_gig.status not in [schemas.GigStatus.ACTIVE]:
-        logger.warning(f"Expert profile not available for expert ID: {expert_id} (status: {db_gig.status})")
+        logger.warning("Expert profile not available for expert ID: %s (status: %s)", expert_id, db_gig.status)
         raise HTTPException(status_code=404, detail="Expert profile not available")
 
-    logger.info(f"Expert gig returned for expert ID: {expert_id}")
+    logger.info("Expert gig returned for expert ID: %s", expert_id)
     return db_gig
 
 
 @router.get("/my/gig", response_model=schemas.GigPrivateResponse)
 def get_my_gig(
-        db: Session = Depends(session.get_db),
+        db: Session = Depends(session.get_read_db),
         current_user_id = Depends(session.get_current_user_id)
 ):
     """
@@ -211,12 +257,12 @@ def get_my_gig(
     # Convert UUID to string if needed
     expert_id = str(current_user_id)
     
-    logger.info(f"Fetching gig for current user ID: {expert_id}")
+    logger.info("Fetching gig for current user ID: %s", expert_id)
     db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
     if not db_gig:
-        logger.warning(f"No gig found for current user ID: {expert_id}")
+        logger.warning("No gig found for current user ID: %s", expert_id)
         raise HTTPException(status_code=404, detail="No gig found for this expert")
-    logger.info(f"Gig returned for current user ID: {expert_id}")
+    logger.info("Gig returned for current user ID: %s", expert_id)
     return db_gig
 
 
@@ -224,7 +270,7 @@ def get_my_gig(
 def get_my_gigs(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db),
+        db: Session = Depends(session.get_read_db),
         current_user_id = Depends(session.get_current_user_id)
 ):
     """
@@ -235,40 +281,17 @@ def get_my_gigs(
     # Convert UUID to string if needed
     expert_id = str(current_user_id)
     
-    logger.info(f"Fetching all gigs for current user ID: {expert_id} with skip={skip}, limit={limit}")
+    logger.info("Fetching all gigs for current user ID: %s with skip=%s, limit=%s", expert_id, skip, limit)
     
     # Get all gigs that belong to this expert (user_id matches gig.expert_id)
     gigs = crud.get_gigs_by_expert(db=db, expert_id=expert_id, skip=skip, limit=limit)
     
-    # Enrich the gigs with additional data (same as get_all_gigs)
-    def enrich_gig(gig):
-        # Convert gig object to dict if it has __dict__ attribute, otherwise use direct conversion
-        if hasattr(gig, '__dict__'):
-            gig_dict = gig.__dict__.copy()
-        else:
-            gig_dict = dict(gig)
-        
-        # Remove SQLAlchemy internal attributes
-        gig_dict.pop('_sa_instance_state', None)
-        
-        # Add enriched fields for frontend display
-        gig_dict.update({
-            'bio': 'Expert in their field. Contact for professional consultation.',
-            'banner_image_url': '/logo.png',
-            'profile_image_url': '/favicon.png',
-            'name': 'Expert Professional',
-            'title': 'Professional Consultant',
-            'rating': 4.8,
-            'total_reviews': 12,
-            'total_consultations': 25
-        })
-        
-        return gig_dict
-    
-    enriched_gigs = [enrich_gig(gig) for gig in gigs]
-    
-    logger.info(f"Returned {len(enriched_gigs)} gigs for current user ID: {expert_id}")
-    return enriched_gigs
+    # The category is already loaded with the rows; the fields are read straight off each
+    # gig, with no per-row dict copy or validation
+    result = [schemas.Gig.from_orm_fast(gig) for gig in gigs]
+
+    logger.info("Returned %s gigs for current user ID: %s", len(result), expert_id)
+    return _gig_list_response(result)
 
 
 @router.put("/my/gig", response_model=schemas.GigPrivateResponse)
@@ -284,26 +307,21 @@ async def update_my_gig(
     # Convert UUID to string if needed
     expert_id = str(current_user_id)
     
-    # First get the gig to ensure it belongs to the current user
-    logger.info(f"Updating gig for current user ID: {expert_id}")
-    logger.debug(f"Gig update data: {jsonable_encoder(gig_update)}")
+    # The UPDATE is scoped to the current user's gig, so ownership needs no separate lookup
+    logger.info("Updating gig for current user ID: %s", expert_id)
+    logger.debug("Gig update data: %s", gig_update)
     
-    db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
-    if not db_gig:
-        logger.warning(f"No gig found for current user ID: {expert_id}")
-        raise HTTPException(status_code=404, detail="No gig found for this expert")
-
-    updated_gig = crud.update_gig(db=db, gig_id=db_gig.id, gig_update=gig_update)
+    updated_gig = await run_in_threadpool(crud.update_gig_by_expert, db=db, expert_id=expert_id, gig_update=gig_update)
     if not updated_gig:
-        logger.error(f"Failed to update gig for current user ID: {expert_id}")
-        raise HTTPException(status_code=404, detail="Failed to update gig")
+        logger.warning("No gig found for current user ID: %s", expert_id)
+        raise HTTPException(status_code=404, detail="No gig found for this expert")
     
     # Handle certificate files if any were uploaded
     if certificate_files:
         try:
             # Save the certificate files and get their paths
             certificate_paths = await save_certificate_files(certificate_files, updated_gig.id)
-            logger.info(f"Saved {len(certificate_paths)} certificate files for gig {updated_gig.id}")
+            logger.info("Saved %s certificate files for gig %s", len(certificate_paths), updated_gig.id)
             
             # Update the gig with the certificate paths if any were saved
             if certificate_paths:
@@ -312,16 +330,19 @@ async def update_my_gig(
                 
                 # Add new certificate paths to existing ones
                 updated_gig.certification = existing_certs + certificate_paths
-                db.commit()
-                logger.info(f"Updated gig {updated_gig.id} with certificate paths")
+                await run_in_threadpool(
+                    crud.create_certifications_bulk, db=db, gig_id=updated_gig.id,
+                    certifications=[(path, None) for path in certificate_paths]
+                )
+                logger.info("Updated gig %s with certificate paths", updated_gig.id)
         except Exception as e:
-            logger.error(f"Error saving certificate files during update: {str(e)}")
+            logger.error("Error saving certificate files during update: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to upload certificate files",
             ) from e
 
-    logger.info(f"Gig updated for current user ID: {expert_id}")
+    logger.info("Gig updated for current user ID: %s", expert_id)
     return updated_gig
 
 
@@ -336,19 +357,14 @@ def delete_my_gig(
     # Convert UUID to string if needed
     expert_id = str(current_user_id)
     
-    # First get the gig to ensure it belongs to the current user
-    logger.info(f"Deleting gig for current user ID: {expert_id}")
-    db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
-    if not db_gig:
-        logger.warning(f"No gig found for current user ID: {expert_id}")
+    # The DELETE is scoped to the current user's gig, so ownership needs no separate lookup
+    logger.info("Deleting gig for current user ID: %s", expert_id)
+    deleted_gig_id = crud.delete_gig_by_expert(db=db, expert_id=expert_id)
+    if deleted_gig_id is None:
+        logger.warning("No gig found for current user ID: %s", expert_id)
         raise HTTPException(status_code=404, detail="No gig found for this expert")
 
-    success = crud.delete_gig(db=db, gig_id=db_gig.id)
-    if not success:
-        logger.error(f"Failed to delete gig for current user ID: {expert_id}")
-        raise HTTPException(status_code=500, detail="Failed to delete gig")
-
-    logger.info(f"Gig deleted for current user ID: {expert_id}")
+    logger.info("Gig deleted for current user ID: %s", expert_id)
     return None  # 204 No Content response
 
 
@@ -366,10 +382,10 @@ async def upload_certificates(
     expert_id = str(current_user_id)
     
     # First get the gig to ensure it exists and belongs to the current user
-    logger.info(f"Uploading certificates for expert ID: {expert_id}")
-    db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
+    logger.info("Uploading certificates for expert ID: %s", expert_id)
+    db_gig = await run_in_threadpool(crud.get_gig_by_expert, db=db, expert_id=expert_id)
     if not db_gig:
-        logger.warning(f"No gig found for current user ID: {expert_id}")
+        logger.warning("No gig found for current user ID: %s", expert_id)
         raise HTTPException(status_code=404, detail="No gig found for this expert")
     
     if not certificate_files:
@@ -378,24 +394,26 @@ async def upload_certificates(
     try:
         # Save the certificate files and get their paths
         certificate_paths = await save_certificate_files(certificate_files, db_gig.id)
-        logger.info(f"Saved {len(certificate_paths)} certificate files for gig {db_gig.id}")
+        logger.info("Saved %s certificate files for gig %s", len(certificate_paths), db_gig.id)
         
         # Update the gig with the certificate paths
         existing_certs = db_gig.certification or []
         db_gig.certification = existing_certs + certificate_paths
-        db.commit()
-        db.refresh(db_gig)
+        await run_in_threadpool(
+            crud.create_certifications_bulk, db=db, gig_id=db_gig.id,
+            certifications=[(path, None) for path in certificate_paths]
+        )
         
-        logger.info(f"Updated gig {db_gig.id} with new certificate paths")
+        logger.info("Updated gig %s with new certificate paths", db_gig.id)
         return db_gig
         
     except Exception as e:
-        logger.error(f"Error uploading certificates: {str(e)}")
+        logger.error("Error uploading certificates: %s", e)
         raise HTTPException(status_code=500, detail="Failed to upload certificate files")
 
 
 @router.delete("/my/gig/certificates/{certificate_index}", response_model=schemas.GigPrivateResponse)
-async def delete_certificate(
+def delete_certificate(
     certificate_index: int,
     db: Session = Depends(session.get_db),
     current_user_id = Depends(session.get_current_user_id)
@@ -407,10 +425,10 @@ async def delete_certificate(
     expert_id = str(current_user_id)
     
     # First get the gig to ensure it exists and belongs to the current user
-    logger.info(f"Deleting certificate for expert ID: {expert_id} at index {certificate_index}")
+    logger.info("Deleting certificate for expert ID: %s at index %s", expert_id, certificate_index)
     db_gig = crud.get_gig_by_expert(db=db, expert_id=expert_id)
     if not db_gig:
-        logger.warning(f"No gig found for current user ID: {expert_id}")
+        logger.warning("No gig found for current user ID: %s", expert_id)
         raise HTTPException(status_code=404, detail="No gig found for this expert")
     
     # Check if certificate exists
@@ -423,8 +441,7 @@ async def delete_certificate(
         
         # Remove the certificate from the list
         db_gig.certification = [cert for i, cert in enumerate(db_gig.certification) if i != certificate_index]
-        db.commit()
-        db.refresh(db_gig)
+        crud.delete_certification_by_url(db=db, gig_id=db_gig.id, url=certificate_path)
         
         # Try to delete the file (non-blocking)
         try:
@@ -433,16 +450,16 @@ async def delete_certificate(
             full_path = os.path.join(UPLOAD_DIR, certificate_path)
             if os.path.exists(full_path):
                 os.remove(full_path)
-                logger.info(f"Deleted certificate file: {full_path}")
+                logger.info("Deleted certificate file: %s", full_path)
         except Exception as file_e:
             # Just log the error, don't fail the request
-            logger.warning(f"Could not delete certificate file: {str(file_e)}")
+            logger.warning("Could not delete certificate file: %s", file_e)
         
-        logger.info(f"Removed certificate at index {certificate_index} from gig {db_gig.id}")
+        logger.info("Removed certificate at index %s from gig %s", certificate_index, db_gig.id)
         return db_gig
         
     except Exception as e:
-        logger.error(f"Error deleting certificate: {str(e)}")
+        logger.error("Error deleting certificate: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete certificate: {str(e)}")
 
 
@@ -451,18 +468,27 @@ async def delete_certificate(
 def get_pending_gigs_for_admin(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db)
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        db: Session = Depends(session.get_read_db)
 ):
     """
-    Get all gigs with pending status for admin verification.
+    Get all gigs with pending status for admin verification, newest first.
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next page.
     """
-    logger.info(f"Admin fetching pending gigs: skip={skip}, limit={limit}")
+    logger.info("Admin fetching pending gigs: skip=%s, limit=%s, cursor=%s", skip, limit, cursor)
+    after = _decode_cursor_or_400(cursor)
     try:
-        pending_gigs = crud.get_pending_gigs(db=db, skip=skip, limit=limit)
-        logger.info(f"Retrieved {len(pending_gigs)} pending gigs")
-        return pending_gigs
+        pending_gigs = crud.get_pending_gigs(db=db, skip=skip, limit=limit, after=after)
+        headers = {}
+        if len(pending_gigs) == limit:
+            headers["X-Next-Cursor"] = crud.encode_gig_cursor(pending_gigs[-1])
+        logger.info("Retrieved %s pending gigs", len(pending_gigs))
+        categories = crud.get_categories_for_gigs(db=db, gigs=pending_gigs)
+        return _gig_list_response(
+            [schemas.Gig.from_orm_fast(gig, categories[gig.category_id]) for gig in pending_gigs], headers
+        )
     except Exception as e:
-        logger.error(f"Error getting pending gigs: {e}")
+        logger.error("Error getting pending gigs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get pending gigs: {str(e)}")
 
 
@@ -470,20 +496,21 @@ def get_pending_gigs_for_admin(
 def get_active_gigs_for_admin(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db)
+        db: Session = Depends(session.get_read_db)
 ):
     """
-    Get all gigs with active status for admin review.
+    Get all gigs with active status for admin review, newest first.
     """
-    logger.info(f"Admin fetching active gigs: skip={skip}, limit={limit}")
+    logger.info("Admin fetching active gigs: skip=%s, limit=%s", skip, limit)
     try:
-        active_gigs = db.query(crud.Gig).filter(
-            crud.Gig.status == schemas.GigStatus.ACTIVE
-        ).offset(skip).limit(limit).all()
-        logger.info(f"Retrieved {len(active_gigs)} active gigs")
-        return active_gigs
+        active_gigs = crud.get_gigs_by_status(db=db, status=schemas.GigStatus.ACTIVE, skip=skip, limit=limit)
+        logger.info("Retrieved %s active gigs", len(active_gigs))
+        categories = crud.get_categories_for_gigs(db=db, gigs=active_gigs)
+        return _gig_list_response(
+            [schemas.Gig.from_orm_fast(gig, categories[gig.category_id]) for gig in active_gigs]
+        )
     except Exception as e:
-        logger.error(f"Error getting active gigs: {e}")
+        logger.error("Error getting active gigs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get active gigs: {str(e)}")
 
 
@@ -491,71 +518,68 @@ def get_active_gigs_for_admin(
 def get_hold_gigs_for_admin(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db)
+        db: Session = Depends(session.get_read_db)
 ):
     """
-    Get all gigs with hold status for admin review.
+    Get all gigs with hold status for admin review, newest first.
     """
-    logger.info(f"Admin fetching hold gigs: skip={skip}, limit={limit}")
+    logger.info("Admin fetching hold gigs: skip=%s, limit=%s", skip, limit)
     try:
-        hold_gigs = db.query(crud.Gig).filter(
-            crud.Gig.status == schemas.GigStatus.HOLD
-        ).offset(skip).limit(limit).all()
-        logger.info(f"Retrieved {len(hold_gigs)} hold gigs")
-        return hold_gigs
+        hold_gigs = crud.get_gigs_by_status(db=db, status=schemas.GigStatus.HOLD, skip=skip, limit=limit)
+        logger.info("Retrieved %s hold gigs", len(hold_gigs))
+        categories = crud.get_categories_for_gigs(db=db, gigs=hold_gigs)
+        return _gig_list_response(
+            [schemas.Gig.from_orm_fast(gig, categories[gig.category_id]) for gig in hold_gigs]
+        )
     except Exception as e:
-        logger.error(f"Error getting hold gigs: {e}")
+        logger.error("Error getting hold gigs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get hold gigs: {str(e)}")
 
 
 @router.put("/admin/{gig_id}/activate", response_model=schemas.Gig)
 def activate_gig_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Activate a gig (change status from HOLD to ACTIVE).
     """
-    logger.info(f"Admin activating gig: {gig_id}")
+    logger.info("Admin activating gig: %s", gig_id)
     try:
-        gig = crud.get_gig(db=db, gig_id=gig_id)
+        # Update status to ACTIVE
+        gig = crud.update_gig_status(
+            db=db, gig_id=gig_id, status_update=schemas.GigStatusUpdate(status=schemas.GigStatus.ACTIVE)
+        )
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
-        
-        # Update status to ACTIVE
-        gig.status = schemas.GigStatus.ACTIVE
-        db.commit()
-        db.refresh(gig)
-        logger.info(f"Gig {gig_id} activated successfully")
+        logger.info("Gig %s activated successfully", gig_id)
         return gig
     except Exception as e:
-        logger.error(f"Error activating gig: {e}")
+        logger.error("Error activating gig: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to activate gig: {str(e)}")
 
 
 @router.put("/admin/{gig_id}/reject", response_model=schemas.Gig)
 def reject_gig_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Reject a gig (change status to REJECTED).
     """
-    logger.info(f"Admin rejecting gig: {gig_id}")
+    logger.info("Admin rejecting gig: %s", gig_id)
     try:
-        gig = crud.get_gig(db=db, gig_id=gig_id)
+        # Update status to REJECTED
+        gig = crud.update_gig_status(
+            db=db, gig_id=gig_id, status_update=schemas.GigStatusUpdate(status=schemas.GigStatus.REJECTED)
+        )
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
-        
-        # Update status to REJECTED
-        gig.status = schemas.GigStatus.REJECTED
-        db.commit()
-        db.refresh(gig)
-        logger.info(f"Gig {gig_id} rejected successfully")
+        logger.info("Gig %s rejected successfully", gig_id)
         return gig
     except Exception as e:
-        logger.error(f"Error rejecting gig: {e}")
+        logger.error("Error rejecting gig: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to reject gig: {str(e)}")
 
@@ -564,127 +588,133 @@ def reject_gig_for_admin(
 def get_rejected_gigs_for_admin(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        db: Session = Depends(session.get_db)
+        db: Session = Depends(session.get_read_db)
 ):
     """
-    Get all gigs with rejected status for admin review.
+    Get all gigs with rejected status for admin review, newest first.
     """
-    logger.info(f"Admin fetching rejected gigs: skip={skip}, limit={limit}")
+    logger.info("Admin fetching rejected gigs: skip=%s, limit=%s", skip, limit)
     try:
-        rejected_gigs = db.query(crud.Gig).filter(
-            crud.Gig.status == schemas.GigStatus.REJECTED
-        ).offset(skip).limit(limit).all()
-        logger.info(f"Retrieved {len(rejected_gigs)} rejected gigs")
-        return rejected_gigs
+        rejected_gigs = crud.get_gigs_by_status(db=db, status=schemas.GigStatus.REJECTED, skip=skip, limit=limit)
+        logger.info("Retrieved %s rejected gigs", len(rejected_gigs))
+        categories = crud.get_categories_for_gigs(db=db, gigs=rejected_gigs)
+        return _gig_list_response(
+            [schemas.Gig.from_orm_fast(gig, categories[gig.category_id]) for gig in rejected_gigs]
+        )
     except Exception as e:
-        logger.error(f"Error getting rejected gigs: {e}")
+        logger.error("Error getting rejected gigs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get rejected gigs: {str(e)}")
 
 
 @router.put("/admin/{gig_id}/reactivate", response_model=schemas.Gig)
 def reactivate_rejected_gig(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Reactivate a rejected gig (change status from REJECTED to ACTIVE).
     """
-    logger.info(f"Admin reactivating rejected gig: {gig_id}")
+    logger.info("Admin reactivating rejected gig: %s", gig_id)
     try:
-        gig = crud.get_gig(db=db, gig_id=gig_id)
+        # Update status to ACTIVE
+        gig = crud.update_gig_status(
+            db=db, gig_id=gig_id, status_update=schemas.GigStatusUpdate(status=schemas.GigStatus.ACTIVE)
+        )
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
-        
-        # Update status to ACTIVE
-        gig.status = schemas.GigStatus.ACTIVE
-        db.commit()
-        db.refresh(gig)
-        logger.info(f"Rejected gig {gig_id} reactivated successfully")
+        logger.info("Rejected gig %s reactivated successfully", gig_id)
         return gig
     except Exception as e:
-        logger.error(f"Error reactivating gig: {e}")
+        logger.error("Error reactivating gig: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to reactivate gig: {str(e)}")
 
 
 @router.delete("/admin/{gig_id}/delete")
 def delete_rejected_gig(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Permanently delete a rejected gig from the database.
     """
-    logger.info(f"Admin deleting rejected gig: {gig_id}")
+    logger.info("Admin deleting rejected gig: %s", gig_id)
     try:
-        gig = crud.get_gig(db=db, gig_id=gig_id)
-        if not gig:
-            raise HTTPException(status_code=404, detail="Gig not found")
-        
         # Delete the gig
-        db.delete(gig)
-        db.commit()
-        logger.info(f"Gig {gig_id} deleted successfully")
+        if not crud.delete_gig(db=db, gig_id=gig_id):
+            raise HTTPException(status_code=404, detail="Gig not found")
+        logger.info("Gig %s deleted successfully", gig_id)
         return {"success": True, "message": f"Gig {gig_id} deleted successfully"}
     except Exception as e:
-        logger.error(f"Error deleting gig: {e}")
+        logger.error("Error deleting gig: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete gig: {str(e)}")
 
 
+@router.delete("/admin/auth-cache/{firebase_uid}")
+def clear_cached_user(
+        firebase_uid: str,
+        admin_id = Depends(session.get_current_admin_id)
+):
+    """
+    Forget the cached user ID for a Firebase UID, e.g. after the user is deleted,
+    so the next request resolves it from the user service again. Admins only.
+    """
+    logger.info("Admin %s clearing cached user ID for Firebase UID: %s", admin_id, firebase_uid)
+    session.forget_user(firebase_uid)
+    return {"success": True, "message": f"Cached user for {firebase_uid} cleared"}
+
+
 @router.get("/admin/{gig_id}", response_model=schemas.Gig)
 def get_gig_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Get specific gig details for admin verification.
     Note: This is redundant with the pending endpoint but kept for API compatibility.
     """
-    logger.info(f"Admin fetching gig details: {gig_id}")
+    logger.info("Admin fetching gig details: %s", gig_id)
     try:
         gig = crud.get_gig(db=db, gig_id=gig_id)
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
         return gig
     except Exception as e:
-        logger.error(f"Error getting gig details: {e}")
+        logger.error("Error getting gig details: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get gig details: {str(e)}")
 
 
 @router.get("/admin/{gig_id}/certificates")
 def get_gig_certificates_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Get certificates for a specific gig for admin verification.
     """
-    logger.info(f"Admin fetching certificates for gig: {gig_id}")
+    logger.info("Admin fetching certificates for gig: %s", gig_id)
     try:
-        # First check if gig exists
-        gig = crud.get_gig(db=db, gig_id=gig_id)
+        # Load the gig together with its certifications
+        gig = crud.get_gig_with_certifications(db=db, gig_id=gig_id)
         if not gig:
             raise HTTPException(status_code=404, detail="Gig not found")
         
-        # Get certifications for this gig
-        certifications = crud.get_certifications_by_gig(db=db, gig_id=gig_id)
-        
         # Convert to response format
         certificates = []
-        for cert in certifications:
+        for cert in gig.certifications:
             certificates.append({
                 "id": str(cert.id),
-                "gig_id": cert.gig_id,
+                "gig_id": str(cert.gig_id),
                 "url": cert.url,
                 "thumbnail_url": cert.thumbnail_url,
                 "uploaded_at": cert.uploaded_at.isoformat() if cert.uploaded_at else None
             })
         
-        logger.info(f"Retrieved {len(certificates)} certificates for gig: {gig_id}")
+        logger.info("Retrieved %s certificates for gig: %s", len(certificates), gig_id)
         return certificates
     except Exception as e:
-        logger.error(f"Error getting gig certificates: {e}")
+        logger.error("Error getting gig certificates: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get gig certificates: {str(e)}")
 
 
@@ -696,26 +726,26 @@ def get_category_for_admin(
     """
     Get category details for admin verification.
     """
-    logger.info(f"Admin fetching category: {category_id}")
+    logger.info("Admin fetching category: %s", category_id)
     try:
         category = crud.get_category(db=db, category_id=str(category_id))
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
         return {"id": category.id, "name": category.name, "description": category.description}
     except Exception as e:
-        logger.error(f"Error getting category: {e}")
+        logger.error("Error getting category: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get category: {str(e)}")
 
 
 @router.post("/admin/{gig_id}/approve")
 def approve_gig_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Approve a gig (change status to approved).
     """
-    logger.info(f"Admin approving gig: {gig_id}")
+    logger.info("Admin approving gig: %s", gig_id)
     try:
         gig = crud.get_gig(db=db, gig_id=gig_id)
         if not gig:
@@ -731,22 +761,22 @@ def approve_gig_for_admin(
         if not updated_gig:
             raise HTTPException(status_code=500, detail="Failed to update gig status")
             
-        logger.info(f"Gig {gig_id} approved and activated successfully")
+        logger.info("Gig %s approved and activated successfully", gig_id)
         return {"message": "Gig approved and activated successfully", "gig_id": gig_id}
     except Exception as e:
-        logger.error(f"Error approving gig: {e}")
+        logger.error("Error approving gig: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to approve gig: {str(e)}")
 
 
 @router.post("/admin/{gig_id}/reject")
 def reject_gig_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Reject a gig (change status to rejected).
     """
-    logger.info(f"Admin rejecting gig: {gig_id}")
+    logger.info("Admin rejecting gig: %s", gig_id)
     try:
         gig = crud.get_gig(db=db, gig_id=gig_id)
         if not gig:
@@ -762,22 +792,22 @@ def reject_gig_for_admin(
         if not updated_gig:
             raise HTTPException(status_code=500, detail="Failed to update gig status")
             
-        logger.info(f"Gig {gig_id} rejected successfully")
+        logger.info("Gig %s rejected successfully", gig_id)
         return {"message": "Gig rejected successfully", "gig_id": gig_id}
     except Exception as e:
-        logger.error(f"Error rejecting gig: {e}")
+        logger.error("Error rejecting gig: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to reject gig: {str(e)}")
 
 
 @router.post("/admin/{gig_id}/hold")
 def put_gig_on_hold_for_admin(
-        gig_id: str,
+        gig_id: uuid.UUID,
         db: Session = Depends(session.get_db)
 ):
     """
     Put a gig on hold (change status to hold).
     """
-    logger.info(f"Admin putting gig on hold: {gig_id}")
+    logger.info("Admin putting gig on hold: %s", gig_id)
     try:
         gig = crud.get_gig(db=db, gig_id=gig_id)
         if not gig:
@@ -793,53 +823,49 @@ def put_gig_on_hold_for_admin(
         if not updated_gig:
             raise HTTPException(status_code=500, detail="Failed to update gig status")
             
-        logger.info(f"Gig {gig_id} put on hold successfully")
+        logger.info("Gig %s put on hold successfully", gig_id)
         return {"message": "Gig put on hold successfully", "gig_id": gig_id}
     except Exception as e:
-        logger.error(f"Error putting gig on hold: {e}")
+        logger.error("Error putting gig on hold: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to put gig on hold: {str(e)}")
 
 
 @router.get("/admin/users/{user_id}")
 async def get_user_details_for_admin(
-        user_id: str,
-        db: Session = Depends(session.get_db)
+        user_id: str
 ):
     """
     Get user details for admin verification by calling the user service.
+    Runs entirely on the event loop: no database session, and the shared user-service client.
     """
-    logger.info(f"Admin fetching user details from user service: {user_id}")
+    logger.info("Admin fetching user details from user service: %s", user_id)
     try:
         import httpx
         
-        # Call the user service directly
-        user_service_url = "http://localhost:8006"  # User service URL
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{user_service_url}/admin/users/{user_id}")
-                
-                if response.status_code == 200:
-                    user_data = response.json()
-                    logger.info(f"Successfully retrieved user details for: {user_id}")
-                    return user_data
-                elif response.status_code == 404:
-                    raise HTTPException(status_code=404, detail="User not found")
-                else:
-                    logger.error(f"User service returned status {response.status_code}: {response.text}")
-                    raise HTTPException(status_code=500, detail=f"User service error: {response.status_code}")
-                    
-            except httpx.RequestError as e:
-                logger.error(f"Failed to connect to user service: {e}")
-                raise HTTPException(status_code=503, detail="User service unavailable")
+        try:
+            response = await session.user_service_client.get(f"/admin/users/{user_id}")
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                logger.info("Successfully retrieved user details for: %s", user_id)
+                return user_data
+            elif response.status_code == 404:
+                raise HTTPException(status_code=404, detail="User not found")
+            else:
+                logger.error("User service returned status %s: %s", response.status_code, response.text)
+                raise HTTPException(status_code=500, detail=f"User service error: {response.status_code}")
                 
+        except httpx.RequestError as e:
+            logger.error("Failed to connect to user service: %s", e)
+            raise HTTPException(status_code=503, detail="User service unavailable")
+            
     except Exception as e:
-        logger.error(f"Error getting user details: {e}")
+        logger.error("Error getting user details: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get user details: {str(e)}")
 
 
 @router.get("/admin/analytics/gigs", response_model=schemas.GigAnalyticsResponse)
-async def get_gig_analytics(
+def get_gig_analytics(
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
     end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
     db: Session = Depends(session.get_db)
@@ -849,21 +875,21 @@ async def get_gig_analytics(
     Returns daily gig counts within the specified date range.
     """
     try:
-        logger.info(f"Getting gig analytics for date range: {start_date} to {end_date}")
+        logger.info("Getting gig analytics for date range: %s to %s", start_date, end_date)
         
         # Get analytics data from database
         analytics_data = crud.get_gig_analytics(db, start_date, end_date)
         
-        logger.info(f"Retrieved {len(analytics_data.data)} analytics data points")
+        logger.info("Retrieved %s analytics data points", len(analytics_data.data))
         return analytics_data
         
     except Exception as e:
-        logger.error(f"Error getting gig analytics: {e}")
+        logger.error("Error getting gig analytics: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get gig analytics: {str(e)}")
 
 
 @router.get("/admin/analytics/total-stats")
-async def get_gig_total_stats(
+def get_gig_total_stats(
     db: Session = Depends(session.get_db)
 ):
     """
@@ -875,17 +901,17 @@ async def get_gig_total_stats(
         # Get total count of active gigs
         total_active_gigs = crud.get_total_active_gigs(db)
         
-        logger.info(f"Total active gigs: {total_active_gigs}")
+        logger.info("Total active gigs: %s", total_active_gigs)
         return {"totalGigs": total_active_gigs}
         
     except Exception as e:
-        logger.error(f"Error getting total gig stats: {e}")
+        logger.error("Error getting total gig stats: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get total gig stats: {str(e)}")
 
 
 @router.get("/admin/analytics/status-counts")
-async def get_gig_status_counts(
-    db: Session = Depends(session.get_db)
+def get_gig_status_counts(
+    db: Session = Depends(session.get_read_db)
 ):
     """
     Get count of gigs by status - returns counts for PENDING, ACTIVE, HOLD, and REJECTED statuses.
@@ -893,22 +919,19 @@ async def get_gig_status_counts(
     try:
         logger.info("Getting gig status counts")
         
-        # Get counts for each status using the GigStatus enum
-        pending_count = db.query(crud.Gig).filter(crud.Gig.status == schemas.GigStatus.PENDING).count()
-        active_count = db.query(crud.Gig).filter(crud.Gig.status == schemas.GigStatus.ACTIVE).count()
-        hold_count = db.query(crud.Gig).filter(crud.Gig.status == schemas.GigStatus.HOLD).count()
-        rejected_count = db.query(crud.Gig).filter(crud.Gig.status == schemas.GigStatus.REJECTED).count()
+        # One grouped count query instead of one COUNT per status
+        counts = crud.get_gig_status_counts(db)
         
         result = {
-            "pending": pending_count,
-            "active": active_count,
-            "hold": hold_count,
-            "rejected": rejected_count
+            "pending": counts[schemas.GigStatus.PENDING],
+            "active": counts[schemas.GigStatus.ACTIVE],
+            "hold": counts[schemas.GigStatus.HOLD],
+            "rejected": counts[schemas.GigStatus.REJECTED]
         }
         
-        logger.info(f"Status counts: {result}")
+        logger.info("Status counts: %s", result)
         return result
         
     except Exception as e:
-        logger.error(f"Error getting gig status counts: {e}")
+        logger.error("Error getting gig status counts: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get gig status counts: {str(e)}")
@@ -8,13 +8,13 @@ import firebase_admin
 import logging
 
 
-from app.db.session import get_db
+from app.db.session import get_db, get_firebase_app
 from app.db.schemas import UserDTO, UserRole
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
-# Initialize Firebase Admin SDK
+# Firebase Admin SDK is initialized on first use by app.db.session.get_firebase_app
 
 
 #     cred = credentials.Certificate({
@@ -30,9 +30,6 @@ logger = logging.getLogger(__name__)
 #         "client_x509_cert_url": settings.firebase_client_x509_cert_url,
 #     })
 
-if not firebase_admin._apps:
-    cred = credentials.Certificate("serviceAccountKey.json")
-    firebase_admin.initialize_app(cred)
 # Security scheme
 security = HTTPBearer()
 
@@ -47,45 +44,45 @@ async def get_current_user(
     try:
         # Verify Firebase token
         token = credentials.credentials
-        logger.debug(f"🔐 Attempting to verify token: {token[:50]}...")
-        logger.debug(f"🔐 Token length: {len(token)}")
-        logger.debug(f"🔐 Token type: {type(token)}")
+        logger.debug("🔐 Attempting to verify token: %s...", token[:50])
+        logger.debug("🔐 Token length: %s", len(token))
+        logger.debug("🔐 Token type: %s", type(token))
 
         # Add Firebase app info
         try:
-            app = firebase_admin.get_app()
-            logger.debug(f"🔐 Firebase app initialized: {app.project_id}")
+            app = get_firebase_app()
+            logger.debug("🔐 Firebase app initialized: %s", app.project_id)
         except Exception as app_error:
-            logger.error(f"🔐 Firebase app error: {app_error}")
+            logger.error("🔐 Firebase app error: %s", app_error)
 
         decoded_token = auth.verify_id_token(token)
         firebase_uid = decoded_token['uid']
-        logger.info(f"✅ Token verified successfully for Firebase UID: {firebase_uid}")
-        logger.debug(f"✅ Decoded token keys: {list(decoded_token.keys())}")
+        logger.info("✅ Token verified successfully for Firebase UID: %s", firebase_uid)
+        logger.debug("✅ Decoded token keys: %s", list(decoded_token))
 
         # Get user from database
         result = await db.execute(select(UserDTO).where(UserDTO.firebase_uid == firebase_uid))
         user = result.scalar_one_or_none()
 
         if not user:
-            logger.warning(f"UserDTO not found in database for Firebase UID: {firebase_uid}")
+            logger.warning("UserDTO not found in database for Firebase UID: %s", firebase_uid)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="UserDTO not found"
             )
 
-        logger.info(f"UserDTO found in database: {user.id}")
+        logger.info("UserDTO found in database: %s", user.id)
         return user
 
     except auth.InvalidIdTokenError as e:
-        logger.error(f"Invalid ID token error: {e}")
+        logger.error("Invalid ID token error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
         )
     except Exception as e:
-        logger.error(f"Authentication error: {e}")
-        logger.error(f"Error type: {type(e)}")
+        logger.error("Authentication error: %s", e)
+        logger.error("Error type: %s", type(e))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication failed"
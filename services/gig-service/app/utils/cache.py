@@ -0,0 +1,67 @@
+import threading
+
+from cachetools import TTLCache
+
+
+class LockedTTLCache(TTLCache):
+    """
+    A cachetools TTLCache whose operations are serialized by a per-cache lock.
+
+    cachetools caches are not thread-safe, and the service's caches are shared by threadpool
+    workers and the event loop: an unguarded lookup racing a write, an expiry or clear() can
+    raise KeyError or leave the cache's internal links inconsistent. The lock is reentrant
+    because composite operations (get, pop, setdefault) call the guarded primitives.
+    """
+
+    def __init__(self, maxsize, ttl, **kwargs):
+        super().__init__(maxsize, ttl, **kwargs)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return super().__contains__(key)
+
+    def __len__(self):
+        with self._lock:
+            return super().__len__()
+
+    def __iter__(self):
+        # Iterate over a snapshot so concurrent writes can't invalidate the iterator
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+
+    def pop(self, key, *args):
+        with self._lock:
+            return super().pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            return super().setdefault(key, default)
+
+    def popitem(self):
+        with self._lock:
+            return super().popitem()
+
+    def expire(self, time=None):
+        with self._lock:
+            return super().expire(time)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
@@ -4,7 +4,7 @@ from typing import Optional
 import cloudinary
 import cloudinary.uploader
 
-from app.utils.config import settings
+from app.core.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
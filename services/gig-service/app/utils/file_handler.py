@@ -4,7 +4,7 @@ from typing import List
 from fastapi import UploadFile
 
 from app.utils.cloudinary_client import upload_file
-from app.utils.config import settings
+from app.core.config import settings
 from app.utils.logger import get_logger
 
 # Configure logger
@@ -1,5 +1,9 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+import anyio.to_thread
+import asyncio
 from alembic.config import Config
 from alembic import command
 import os
@@ -8,7 +12,7 @@ from typing import AsyncIterator
 import logging
 import time
 
-from app.db import session
+from app.db import crud, session
 from app.endpoints import gig, category, analytics
 
 # Configure logging
@@ -22,7 +26,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Gig Service")
+# orjson serializes UUID/datetime/enum values natively and much faster than the stdlib json
+app = FastAPI(title="Gig Service", default_response_class=ORJSONResponse)
 
 # CORS
 app.add_middleware(
@@ -31,6 +36,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor for gig listings
 )
 
 # Request logging middleware
@@ -39,21 +45,21 @@ async def log_requests(request: Request, call_next):
     request_id = request.headers.get("X-Request-Id", "")
     start_time = time.time()
     
-    logger.info(f"Request started: {request.method} {request.url.path} (ID: {request_id})")
+    logger.info("Request started: %s %s (ID: %s)", request.method, request.url.path, request_id)
     
     try:
         response = await call_next(request)
         process_time = time.time() - start_time
         logger.info(
-            f"Request completed: {request.method} {request.url.path} "
-            f"- Status: {response.status_code} - Duration: {process_time:.3f}s (ID: {request_id})"
+            "Request completed: %s %s - Status: %s - Duration: %.3fs (ID: %s)",
+            request.method, request.url.path, response.status_code, process_time, request_id
         )
         return response
     except Exception as e:
         process_time = time.time() - start_time
         logger.error(
-            f"Request failed: {request.method} {request.url.path} "
-            f"- Error: {str(e)} - Duration: {process_time:.3f}s (ID: {request_id})"
+            "Request failed: %s %s - Error: %s - Duration: %.3fs (ID: %s)",
+            request.method, request.url.path, e, process_time, request_id
         )
         raise
 
@@ -88,7 +94,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         command.upgrade(alembic_cfg, "head")
         logger.info("✅ Database migrations completed successfully!")
     except Exception as e:
-        logger.error(f"❌ Database migration failed: {str(e)}")
+        logger.error("❌ Database migration failed: %s", e)
         raise
     
     yield  # Application runs here
@@ -99,6 +105,70 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 # # Attach the lifespan handler to the app
 # app.router.lifespan_context = lifespan
 
+# Worker threads shared by sync endpoints and offloaded blocking calls (Firebase token
+# verification, sync DB sessions). anyio's default of 40 lets a burst of verifications queue
+# behind DB-bound requests.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", 128))
+
+# How often the gig analytics view is refreshed when writes have made it stale
+GIG_ANALYTICS_REFRESH_SECONDS = int(os.getenv("GIG_ANALYTICS_REFRESH_SECONDS", 60))
+
+
+def refresh_gig_analytics_if_stale() -> None:
+    db = session.SessionLocal()
+    try:
+        crud.refresh_gig_analytics_if_stale(db)
+    finally:
+        db.close()
+
+
+async def refresh_gig_analytics_periodically() -> None:
+    """Keeps the dashboard's daily active gig counts current without refreshing on admin writes."""
+    while True:
+        await asyncio.sleep(GIG_ANALYTICS_REFRESH_SECONDS)
+        try:
+            await run_in_threadpool(refresh_gig_analytics_if_stale)
+        except Exception as e:
+            logger.warning("Could not refresh gig analytics: %s", e)
+
+
+# How often each worker logs its database pool usage, for log-based monitoring
+DB_POOL_LOG_SECONDS = int(os.getenv("DB_POOL_LOG_SECONDS", 300))
+
+
+async def log_pool_status_periodically() -> None:
+    """Reports this worker's connection pool usage to the logs instead of over HTTP."""
+    while True:
+        await asyncio.sleep(DB_POOL_LOG_SECONDS)
+        try:
+            logger.info("Database pool status: %s", session.pool_status())
+        except Exception as e:
+            logger.warning("Could not read database pool status: %s", e)
+
+@contextlib.asynccontextmanager
+async def service_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Sizes the worker threadpool, fills the database connection pool and fetches the Firebase
+    token-signing keys on startup so early requests skip connecting and downloading, runs the
+    periodic gig analytics refresh and pool usage logging, and closes the shared user-service and review-service HTTP
+    clients on shutdown.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    await run_in_threadpool(session.warm_pool)
+    await run_in_threadpool(session.warm_firebase_public_keys)
+    background_tasks = [
+        asyncio.create_task(refresh_gig_analytics_periodically()),
+        asyncio.create_task(log_pool_status_periodically()),
+    ]
+    yield
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await session.user_service_client.aclose()
+    await analytics.review_service_client.aclose()
+
+app.router.lifespan_context = service_lifespan
+
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Gig Service on port 8002")
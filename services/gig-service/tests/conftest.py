@@ -1,11 +1,18 @@
+import os
+
+# Settings are read at import time; default them so the suite runs against in-memory SQLite
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, MetaData, Column, String, Float, Integer, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import create_engine, MetaData, Column, String, Float, Integer, DateTime, Enum, ForeignKey, Text, Uuid
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.pool import StaticPool
 from app.db.models import GigStatus
-from app.db.session import get_db, get_current_user_id
+from app.db.session import get_db, get_read_db, get_current_user_id
 from main import app
 import uuid
 import json
@@ -21,7 +28,7 @@ class Category(TestBase):
     __tablename__ = "categories"
 
     id = Column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        Uuid, primary_key=True, default=uuid.uuid4
     )
     name = Column(String(100), unique=True, nullable=False)
     slug = Column(
@@ -38,9 +45,9 @@ class Certification(TestBase):
     __tablename__ = "certifications"
 
     id = Column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        Uuid, primary_key=True, default=uuid.uuid4
     )
-    gig_id = Column(String, index=True)
+    gig_id = Column(Uuid, index=True)
     url = Column(String, nullable=False)
     thumbnail_url = Column(String, nullable=True)
     uploaded_at = Column(DateTime, server_default=func.now())
@@ -51,9 +58,9 @@ class Certification(TestBase):
 class Gig(TestBase):
     __tablename__ = 'gigs'
     
-    id = Column(String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid, primary_key=True, index=True, default=uuid.uuid4)
     expert_id = Column(String, index=True)
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=False)
+    category_id = Column(Uuid, ForeignKey("categories.id"), nullable=False)
     service_description = Column(Text)
     hourly_rate = Column(Float, nullable=False)
     currency = Column(String, default='LKR')
@@ -67,7 +74,7 @@ class Gig(TestBase):
     work_experience = Column(Text)
     
     # System fields
-    status = Column(Enum(GigStatus), default=GigStatus.DRAFT)
+    status = Column(Enum(GigStatus), default=GigStatus.PENDING)
 
     # Relationships
     category = relationship("Category", back_populates="gigs")
@@ -134,6 +141,7 @@ def client(db_session):
         return "test-expert-id"
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
     
     with TestClient(app) as c:
@@ -148,7 +156,7 @@ def test_category(db_session):
     # Use our local Category model with a unique slug
     unique_id = str(uuid.uuid4()).split("-")[0]
     category = Category(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4(),
         name=f"Test Category {unique_id}",
         slug=f"test-category-{unique_id}"
     )
@@ -162,7 +170,7 @@ def test_gig(db_session, test_category):
     """Create a test gig for use in tests."""
     # Use our local Gig model
     gig = Gig(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4(),
         expert_id="test-expert-id",
         category_id=test_category.id,
         service_description="Test service description",
@@ -10,20 +10,25 @@ crud_functions = [
     'create_category', 'get_all_categories', 'get_category',
     'create_gig', 'get_gig', 'get_gigs_by_expert', 
     'update_gig', 'update_gig_status', 'delete_gig',
-    'get_gigs_filtered', 'get_gigs_count'
+    'get_gigs_filtered', 'get_gigs_count', 'get_gigs_filtered_with_total'
 ]
 
-# Apply patches for the CRUD module
-for func_name in crud_functions:
-    if hasattr(crud, func_name) and hasattr(mock_crud, func_name):
-        setattr(crud, func_name, getattr(mock_crud, func_name))
+# Apply patches for the CRUD module, for this module's tests only
+@pytest.fixture(autouse=True)
+def patch_crud(monkeypatch):
+    for func_name in crud_functions:
+        if hasattr(crud, func_name) and hasattr(mock_crud, func_name):
+            monkeypatch.setattr(crud, func_name, getattr(mock_crud, func_name))
+    # Rendered pages and details must not carry over between tests
+    crud.public_gig_page_cache.clear()
+    crud.gig_detail_cache.clear()
 
 def test_get_root(client):
     """Test the health check endpoint."""
     response = client.get("/")
     assert response.status_code == 200
     data = response.json()
-    assert data["message"] == "Gig Service"
+    assert data["message"] == "Gig Service with Hot Reload - UPDATED"
     assert data["status"] == "Running"
     assert data["port"] == 8002
 
@@ -72,8 +77,8 @@ def test_create_gig(client, test_category):
         "experience_years": 3
     }
     
-    # Act
-    response = client.post("/gigs/", json=gig_data)
+    # Act - gigs are created from form fields (certificate files may ride along)
+    response = client.post("/gigs/", data=gig_data)
     
     # Assert
     assert response.status_code == 201
@@ -133,9 +138,9 @@ def test_get_gig_detail(client, test_gig):
     # Assert
     assert response.status_code == 200
     data = response.json()
-    assert data["gig"]["id"] == test_gig.id
-    assert data["gig"]["service_description"] == test_gig.service_description
-    assert data["gig"]["hourly_rate"] == test_gig.hourly_rate
+    assert data["id"] == str(test_gig.id)
+    assert data["service_description"] == test_gig.service_description
+    assert data["hourly_rate"] == test_gig.hourly_rate
 
 def test_get_gig_detail_not_found(client):
     """Test retrieving a non-existent gig via the API."""
@@ -2,6 +2,8 @@
 Module that provides mock implementations of the CRUD operations to work with test models
 """
 import json
+import uuid
+from types import SimpleNamespace
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.db.schemas import GigCreate, GigUpdate, GigFilters, CategoryCreate
@@ -28,8 +30,12 @@ def get_category(db: Session, category_id: str) -> Optional[Category]:
     Retrieves a single category by its ID or slug.
     First try by ID, then by slug if nothing is found.
     """
-    # Try by ID first
-    category = db.query(Category).filter(Category.id == category_id).first()
+    # Try by ID first (category IDs are UUIDs, so anything else can only be a slug)
+    category = None
+    try:
+        category = db.query(Category).filter(Category.id == uuid.UUID(str(category_id))).first()
+    except ValueError:
+        pass
     
     # If not found, try by slug
     if not category:
@@ -52,7 +58,7 @@ def create_gig(db: Session, gig: GigCreate, expert_id: str) -> Gig:
     db_gig = Gig(
         expert_id=expert_id,
         category_id=category.id,
-        status=GigStatus.DRAFT,
+        status=GigStatus.PENDING,
         currency="LKR",
         response_time="< 24 hours",
         **gig_data
@@ -176,3 +182,17 @@ def get_gigs_count(db: Session, filters: GigFilters) -> int:
         query = query.filter(Gig.service_description.contains(filters.search_query))
     
     return query.count()
+
+
+def get_gigs_filtered_with_total(db: Session, filters: GigFilters, skip: int = 0, limit: int = 100):
+    """Retrieves a page of filtered gigs as card rows, together with the total number of matches."""
+    card_fields = (
+        "id", "expert_id", "category_id", "service_description", "hourly_rate", "currency",
+        "response_time", "thumbnail_url", "expertise_areas", "experience_years", "status", "created_at",
+    )
+    rows = [
+        SimpleNamespace(category_id=gig.category_id,
+                        _mapping={field: getattr(gig, field) for field in card_fields})
+        for gig in get_gigs_filtered(db, filters, skip=skip, limit=limit)
+    ]
+    return rows, get_gigs_count(db, filters)
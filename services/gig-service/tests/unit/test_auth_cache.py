@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.db import session
+
+
+@pytest.fixture
+def firebase_auth(monkeypatch):
+    """Stubs Firebase verification and the user-service lookup, counting the calls to each."""
+    calls = {"verify": 0, "lookup": 0}
+
+    def verify_id_token(token):
+        calls["verify"] += 1
+        return {"uid": "firebase-uid", "exp": 4102444800}
+
+    async def lookup(path):
+        calls["lookup"] += 1
+        return SimpleNamespace(status_code=200, json=lambda: {"id": "user-1"})
+
+    monkeypatch.setattr(session, "get_firebase_app", lambda: object())
+    monkeypatch.setattr(session.auth, "verify_id_token", verify_id_token)
+    monkeypatch.setattr(session.user_service_client, "get", lookup)
+    session._verified_token_cache.clear()
+    session._firebase_uid_cache.clear()
+    yield calls
+    session._verified_token_cache.clear()
+    session._firebase_uid_cache.clear()
+
+
+def authenticate(token):
+    return asyncio.run(session.get_current_user_id(SimpleNamespace(credentials=token)))
+
+
+def test_repeat_token_skips_verification_and_lookup(firebase_auth):
+    """Test that a repeated token is served from the token and UID caches."""
+    assert authenticate("token-a") == "user-1"
+    assert authenticate("token-a") == "user-1"
+
+    assert firebase_auth == {"verify": 1, "lookup": 1}
+
+
+def test_new_token_reverifies_but_reuses_user_id(firebase_auth):
+    """Test that a refreshed token is verified again but skips the user-service lookup."""
+    authenticate("token-a")
+    authenticate("token-b")
+
+    assert firebase_auth == {"verify": 2, "lookup": 1}
+
+
+def test_forget_user_drops_cached_user_id(firebase_auth):
+    """Test that forget_user forces the next request to look the user up again."""
+    authenticate("token-a")
+    session.forget_user("firebase-uid")
+    authenticate("token-b")
+
+    assert firebase_auth["lookup"] == 2
+
+
+def test_expired_cached_token_is_rejected_by_verification(firebase_auth, monkeypatch):
+    """Test that a cached token past its expiry is verified again rather than trusted."""
+    authenticate("token-a")
+    key = next(iter(session._verified_token_cache))
+    session._verified_token_cache[key] = ("firebase-uid", 0)
+
+    def reject(token):
+        raise session.auth.InvalidIdTokenError("expired")
+
+    monkeypatch.setattr(session.auth, "verify_id_token", reject)
+    with pytest.raises(HTTPException) as exc_info:
+        authenticate("token-a")
+    assert exc_info.value.status_code == 401
+
+
+def test_admin_check_uses_role_from_user_service(firebase_auth, monkeypatch):
+    """Test that only users the user service reports as admins pass the admin dependency."""
+    token = SimpleNamespace(credentials="token-a")
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(session.get_current_admin_id(token))
+    assert exc_info.value.status_code == 403
+
+    async def admin_lookup(path):
+        return SimpleNamespace(status_code=200, json=lambda: {"id": "admin-1", "role": "admin"})
+
+    monkeypatch.setattr(session.user_service_client, "get", admin_lookup)
+    session._firebase_uid_cache.clear()
+    assert asyncio.run(session.get_current_admin_id(token)) == "admin-1"
+
+
+def test_clear_cached_user_requires_admin(client):
+    """Test that flushing another user's auth cache needs an admin, not just any caller."""
+    response = client.delete("/gigs/admin/auth-cache/firebase-uid")
+
+    assert response.status_code in (401, 403)
@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.db import crud, schemas
+
+
+@pytest.fixture
+def category():
+    """Caches a category map holding one category."""
+    category = schemas.Category(id=uuid.uuid4(), name="Design", slug="design",
+                                created_at=datetime(2025, 1, 1))
+    crud._category_map_cache["map"] = crud.CategoryMap(by_id={category.id: category},
+                                                       by_slug={category.slug: category})
+    yield category
+    crud._category_map_cache.clear()
+
+
+def make_gig(category_id):
+    return schemas.GigCreate(category_id=category_id, hourly_rate=100.0, expertise_areas=["ui"])
+
+
+def test_create_gigs_bulk_resolves_ids_in_any_case_and_slugs(category, monkeypatch):
+    """Test that upper-case UUIDs and slugs resolve from the map and rows go in batches."""
+    monkeypatch.setattr(crud, "GIG_BULK_INSERT_BATCH_SIZE", 2)
+    crud.public_gig_page_cache["page"] = b"[]"
+    db = MagicMock()
+
+    ids = crud.create_gigs_bulk(db, [
+        ("expert-1", make_gig(str(category.id).upper())),
+        ("expert-2", make_gig("Design")),
+        ("expert-3", make_gig(f" {category.id} ")),
+    ])
+
+    batches = [call.args[1] for call in db.execute.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row["id"] for row in rows] == ids
+    assert {row["category_id"] for row in rows} == {category.id}
+    db.commit.assert_called_once()
+    assert len(crud.public_gig_page_cache) == 0
+
+
+def test_create_gigs_bulk_rejects_unknown_categories(category):
+    """Test that an unknown category fails the whole batch after one map reload."""
+    db = MagicMock()
+    db.execute.return_value.scalars.return_value = [category]
+
+    with pytest.raises(ValueError):
+        crud.create_gigs_bulk(db, [("expert-1", make_gig("design")), ("expert-2", make_gig("missing"))])
+
+    # Only the category reload ran; nothing was inserted or committed
+    assert db.execute.call_count == 1
+    db.commit.assert_not_called()
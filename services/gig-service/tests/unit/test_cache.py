@@ -0,0 +1,48 @@
+import threading
+
+from app.utils.cache import LockedTTLCache
+
+
+def test_locked_ttl_cache_behaves_like_ttl_cache():
+    """Test that the locked cache keeps the TTLCache mapping behaviour."""
+    cache = LockedTTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3  # Evicts the least recently used entry
+
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.pop("c") == 3
+    assert cache.pop("missing", None) is None
+    assert cache.setdefault("d", 4) == 4
+    assert sorted(cache) == ["b", "d"]
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_locked_ttl_cache_is_safe_under_concurrent_use():
+    """Test that concurrent writes, reads, pops, iteration and clears never raise."""
+    cache = LockedTTLCache(maxsize=32, ttl=0.001)
+    errors = []
+
+    def work(worker):
+        try:
+            for i in range(5000):
+                key = (worker * 7 + i) % 100
+                cache[key] = i
+                cache.get(key)
+                cache.pop((key + 1) % 100, None)
+                list(cache)
+                if i % 50 == 0:
+                    cache.clear()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,185 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.db import crud
+from app.db.models import GigStatus
+from app.db.schemas import Category, CategoryCreate, GigUpdate
+
+
+@pytest.fixture
+def filled_gig_caches():
+    """Fills every gig cache that gig writes must drop."""
+    gig_id = uuid.uuid4()
+    crud._gig_count_cache["filters"] = 10
+    crud.public_gig_page_cache["page"] = b"[]"
+    crud.gig_detail_cache[gig_id] = b"{}"
+    crud._gig_analytics_stale.clear()
+    yield gig_id
+    crud._gig_count_cache.clear()
+    crud.public_gig_page_cache.clear()
+    crud.gig_detail_cache.clear()
+
+
+def assert_gig_caches_empty():
+    assert len(crud._gig_count_cache) == 0
+    assert len(crud.public_gig_page_cache) == 0
+    assert len(crud.gig_detail_cache) == 0
+
+
+def test_update_gig_drops_gig_caches(filled_gig_caches):
+    """Test that a gig update clears the counts, listing pages and details."""
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = SimpleNamespace(id=filled_gig_caches)
+
+    crud.update_gig(db, filled_gig_caches, GigUpdate(hourly_rate=120.0))
+
+    db.commit.assert_called_once()
+    assert_gig_caches_empty()
+
+
+def test_update_of_missing_gig_keeps_caches(filled_gig_caches):
+    """Test that an UPDATE matching nothing leaves the caches alone."""
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = None
+
+    assert crud.update_gig(db, filled_gig_caches, GigUpdate(hourly_rate=120.0)) is None
+    assert crud.gig_detail_cache.get(filled_gig_caches) == b"{}"
+
+
+def test_status_change_drops_caches_and_marks_analytics_stale(filled_gig_caches):
+    """Test that a status change clears the gig caches and defers the analytics refresh."""
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = SimpleNamespace(id=filled_gig_caches)
+
+    crud.update_gig_status(db, filled_gig_caches, SimpleNamespace(status=GigStatus.ACTIVE))
+
+    assert_gig_caches_empty()
+    assert crud._gig_analytics_stale.is_set()
+    # Only the UPDATE runs in the request; the view refresh happens out of band
+    assert db.execute.call_count == 1
+
+
+@pytest.mark.parametrize("status, marks_stale", [(GigStatus.ACTIVE, True), (GigStatus.PENDING, False)])
+def test_delete_gig_drops_caches(filled_gig_caches, status, marks_stale):
+    """Test that deletes clear the gig caches and only active deletes touch the analytics."""
+    db = MagicMock()
+    db.execute.return_value.one_or_none.return_value = SimpleNamespace(id=filled_gig_caches, status=status)
+
+    assert crud.delete_gig(db, filled_gig_caches)
+
+    assert_gig_caches_empty()
+    assert crud._gig_analytics_stale.is_set() is marks_stale
+
+
+def test_create_category_drops_category_map():
+    """Test that creating a category invalidates the cached category map."""
+    crud._category_map_cache["map"] = crud.CategoryMap(by_id={}, by_slug={})
+    db = MagicMock()
+    db.execute.return_value.scalar_one.return_value = SimpleNamespace(id=uuid.uuid4())
+
+    crud.create_category(db, CategoryCreate(name="New Category", slug="new-category"))
+
+    assert crud._category_map_cache.get("map") is None
+
+
+@pytest.fixture
+def public_gig_rows(monkeypatch):
+    """Serves the public listing from one in-memory card row, counting the page queries."""
+    category = Category(id=uuid.uuid4(), name="Test Category", slug="test-category",
+                        created_at=datetime(2025, 1, 1))
+    row = SimpleNamespace(category_id=category.id, _mapping={
+        "id": uuid.uuid4(), "expert_id": "expert-1", "category_id": category.id,
+        "service_description": "Test service", "hourly_rate": 100.0, "currency": "LKR",
+        "response_time": "< 24 hours", "thumbnail_url": None, "expertise_areas": ["test"],
+        "experience_years": 3, "status": GigStatus.ACTIVE, "created_at": datetime(2025, 6, 1),
+    })
+    queries = []
+
+    def get_gigs_filtered_with_total(db, filters, skip=0, limit=100):
+        queries.append(filters)
+        return [row], 1
+
+    monkeypatch.setattr(crud, "get_gigs_filtered_with_total", get_gigs_filtered_with_total)
+    monkeypatch.setattr(crud, "get_categories_for_gigs", lambda db, gigs: {category.id: category})
+    crud.public_gig_page_cache.clear()
+    yield queries
+    crud.public_gig_page_cache.clear()
+
+
+def test_public_page_is_cached_until_a_gig_write(client, public_gig_rows):
+    """Test that a repeated public page skips the query until a gig write drops the cache."""
+    first = client.get("/gigs/public")
+    second = client.get("/gigs/public")
+
+    assert second.content == first.content
+    assert first.json()["total"] == 1
+    assert len(public_gig_rows) == 1
+
+    crud._invalidate_gig_caches()
+    client.get("/gigs/public")
+    assert len(public_gig_rows) == 2
+
+
+def test_gig_detail_is_served_from_cache(client, filled_gig_caches, monkeypatch):
+    """Test that a cached detail body is returned without loading the gig."""
+    def get_gig(db, gig_id):
+        raise AssertionError("cached details must not query the gig")
+
+    monkeypatch.setattr(crud, "get_gig", get_gig)
+    response = client.get(f"/gigs/{filled_gig_caches}")
+
+    assert response.status_code == 200
+    assert response.content == b"{}"
+
+
+def test_certification_write_drops_cached_detail(filled_gig_caches):
+    """Test that recording certificates drops the gig's cached detail."""
+    crud.create_certifications_bulk(MagicMock(), filled_gig_caches, [("cert.pdf", None)])
+
+    assert filled_gig_caches not in crud.gig_detail_cache
+
+
+def test_public_page_written_during_query_is_not_cached(client, public_gig_rows, monkeypatch):
+    """Test that a page whose query raced a gig write is served but not cached."""
+    get_gigs = crud.get_gigs_filtered_with_total
+
+    def get_gigs_during_write(db, filters, skip=0, limit=100):
+        rows = get_gigs(db, filters, skip, limit)
+        # A gig write commits and invalidates while the page query is still running
+        crud._invalidate_gig_caches()
+        return rows
+
+    monkeypatch.setattr(crud, "get_gigs_filtered_with_total", get_gigs_during_write)
+    response = client.get("/gigs/public")
+
+    assert response.status_code == 200
+    assert len(crud.public_gig_page_cache) == 0
+
+
+
+
+def test_gig_detail_loaded_during_certification_write_is_not_cached(client, monkeypatch):
+    """Test that a detail whose load raced a certification write is served but not cached."""
+    gig = SimpleNamespace(
+        id=uuid.uuid4(), expert_id="expert-1", service_description="Test service", hourly_rate=100.0,
+        expertise_areas=["test"], experience_years=3, work_experience=None, thumbnail_url=None,
+        status=GigStatus.ACTIVE, currency="LKR", response_time="< 24 hours",
+        created_at=datetime(2025, 6, 1), updated_at=None, approved_at=None,
+        category=Category(id=uuid.uuid4(), name="Test Category", slug="test-category",
+                          created_at=datetime(2025, 1, 1)),
+    )
+
+    def get_gig(db, gig_id):
+        # A certificate for this gig is recorded while its detail is being loaded
+        crud.create_certifications_bulk(MagicMock(), gig_id, [("cert.pdf", None)])
+        return gig
+
+    monkeypatch.setattr(crud, "get_gig", get_gig)
+    response = client.get(f"/gigs/{gig.id}")
+
+    assert response.status_code == 200
+    assert gig.id not in crud.gig_detail_cache
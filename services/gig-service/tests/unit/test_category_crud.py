@@ -30,12 +30,12 @@ def test_get_all_categories(db_session):
     unique_id2 = str(uuid.uuid4()).split("-")[0]
     
     category1 = Category(
-        id=str(uuid.uuid4()), 
+        id=uuid.uuid4(),
         name=f"Category {unique_id1}", 
         slug=f"category-{unique_id1}"
     )
     category2 = Category(
-        id=str(uuid.uuid4()), 
+        id=uuid.uuid4(),
         name=f"Category {unique_id2}", 
         slug=f"category-{unique_id2}"
     )
@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from tests import mock_crud as crud  # Use our mock crud
 from app.db.schemas import GigCreate, GigUpdate, GigFilters
@@ -26,7 +28,7 @@ def test_create_gig(db_session, test_category):
     assert result.hourly_rate == 100.0
     assert result.expertise_areas == ["test1", "test2"]
     assert result.experience_years == 5
-    assert result.status == GigStatus.DRAFT  # Default status should be draft
+    assert result.status == GigStatus.PENDING  # Default status should be pending
     
     # Verify it's in the database
     db_gig = db_session.query(Gig).filter(Gig.id == result.id).first()
@@ -51,7 +53,7 @@ def test_get_gig(db_session, test_gig):
 def test_get_gig_not_found(db_session):
     """Test retrieving a non-existent gig."""
     # Arrange
-    non_existent_id = "non-existent-id"
+    non_existent_id = uuid.uuid4()
     
     # Act
     result = crud.get_gig(db_session, non_existent_id)
@@ -0,0 +1,45 @@
+import pytest
+
+from app.db.models import GigStatus, GigStatusType, GIG_STATUS_CODES, coerce_gig_status
+
+
+def test_gig_status_codes_are_stable():
+    """Test the persisted SMALLINT codes, which partial indexes and the analytics view rely on."""
+    assert GIG_STATUS_CODES == {
+        GigStatus.PENDING: 0,
+        GigStatus.ACTIVE: 1,
+        GigStatus.HOLD: 2,
+        GigStatus.REJECTED: 3,
+    }
+
+
+@pytest.mark.parametrize("value, expected", [
+    (GigStatus.HOLD, GigStatus.HOLD),
+    (1, GigStatus.ACTIVE),
+    ("rejected", GigStatus.REJECTED),
+    ("PENDING", GigStatus.PENDING),
+    (None, None),
+])
+def test_coerce_gig_status(value, expected):
+    """Test that enum members, stored codes, values and names all coerce to a GigStatus."""
+    assert coerce_gig_status(value) is expected
+
+
+@pytest.mark.parametrize("value", [7, "draft"])
+def test_coerce_gig_status_rejects_unknown_values(value):
+    """Test that unknown codes and names are rejected rather than stored."""
+    with pytest.raises(KeyError):
+        coerce_gig_status(value)
+
+
+def test_gig_status_type_round_trip():
+    """Test that statuses are bound as their code and loaded back as GigStatus members."""
+    status_type = GigStatusType()
+
+    for status, code in GIG_STATUS_CODES.items():
+        assert status_type.process_bind_param(status, None) == code
+        assert status_type.process_bind_param(status.value, None) == code
+        assert status_type.process_result_value(code, None) is status
+
+    assert status_type.process_bind_param(None, None) is None
+    assert status_type.process_result_value(None, None) is None
@@ -0,0 +1,92 @@
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.db import crud, schemas
+from app.db.models import GigStatus
+from app.endpoints import gig as gig_endpoints
+
+
+def make_gig(created_at, category_id):
+    """Builds an in-memory gig row carrying every column the list responses serialize."""
+    return SimpleNamespace(
+        id=uuid.uuid4(), expert_id=f"expert-{uuid.uuid4()}", category_id=category_id,
+        service_description="Test service", hourly_rate=100.0, currency="LKR",
+        response_time="< 24 hours", thumbnail_url=None, expertise_areas=["test"],
+        experience_years=3, work_experience=None, status=GigStatus.ACTIVE,
+        created_at=created_at, updated_at=None, approved_at=None,
+    )
+
+
+@pytest.fixture
+def gig_rows(monkeypatch):
+    """Serves GET /gigs/ from three in-memory gigs, newest first."""
+    category = schemas.Category(id=uuid.uuid4(), name="Test Category", slug="test-category",
+                                created_at=datetime(2025, 1, 1))
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    rows = [make_gig(now - timedelta(minutes=i), category.id) for i in range(3)]
+    calls = []
+
+    def fake_get_all_gigs(db, skip=0, limit=100, after=None):
+        calls.append(after)
+        if after:
+            rows_after = [g for g in rows if (g.created_at, g.id) < after]
+            return rows_after[:limit]
+        return rows[skip:skip + limit]
+
+    monkeypatch.setattr(crud, "get_all_gigs", fake_get_all_gigs)
+    monkeypatch.setattr(crud, "get_categories_for_gigs", lambda db, gigs: {category.id: category})
+    return rows, calls
+
+
+def test_gig_cursor_round_trip():
+    """Test that a cursor decodes back to the gig's (created_at, id) keyset position."""
+    gig = make_gig(datetime(2025, 6, 1, 12, 30, 15, 123456), uuid.uuid4())
+
+    cursor = crud.encode_gig_cursor(gig)
+
+    assert crud.decode_gig_cursor(cursor) == (gig.created_at, gig.id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "bm90LWEtY3Vyc29y", "MjAyNS0wNi0wMXxub3QtYS11dWlk"])
+def test_decode_gig_cursor_rejects_malformed_cursors(cursor):
+    """Test that malformed cursors raise ValueError instead of leaking decode errors."""
+    with pytest.raises(ValueError):
+        crud.decode_gig_cursor(cursor)
+
+
+def test_decode_cursor_or_400():
+    """Test that the endpoints treat a missing cursor as the first page and reject bad ones."""
+    assert gig_endpoints._decode_cursor_or_400(None) is None
+
+    with pytest.raises(HTTPException) as exc_info:
+        gig_endpoints._decode_cursor_or_400("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_get_all_gigs_rejects_invalid_cursor(client):
+    """Test that GET /gigs/ answers a malformed cursor with a 400."""
+    response = client.get("/gigs/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_get_all_gigs_pages_with_next_cursor(client, gig_rows):
+    """Test that X-Next-Cursor is only sent on full pages and seeks past the last gig."""
+    rows, calls = gig_rows
+
+    first = client.get("/gigs/", params={"limit": 2})
+    assert first.status_code == 200
+    assert [g["id"] for g in first.json()] == [str(rows[0].id), str(rows[1].id)]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/gigs/", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert [g["id"] for g in second.json()] == [str(rows[2].id)]
+    assert calls[-1] == (rows[1].created_at, rows[1].id)
+    # A short page is the last one
+    assert "X-Next-Cursor" not in second.headers
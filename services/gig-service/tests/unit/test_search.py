@@ -0,0 +1,25 @@
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.db import crud
+from app.db.models import Gig
+from app.db.schemas import GigFilters
+
+
+def test_escape_like_escapes_wildcards():
+    """Test that LIKE wildcards and the escape character are matched literally."""
+    assert crud._escape_like("100%") == "100\\%"
+    assert crud._escape_like("snake_case") == "snake\\_case"
+    assert crud._escape_like("back\\slash") == "back\\\\slash"
+    assert crud._escape_like("plain text") == "plain text"
+
+
+def test_search_query_substring_match_is_escaped():
+    """Test that the search filter binds an escaped pattern with an ESCAPE clause."""
+    query = crud._apply_gig_filters(
+        None, Query(Gig), GigFilters(search_query="50%_off"), "returning empty result"
+    )
+    compiled = query.statement.compile(dialect=postgresql.dialect())
+
+    assert "ESCAPE" in str(compiled)
+    assert "%50\\%\\_off%" in compiled.params.values()
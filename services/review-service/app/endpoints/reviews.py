@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 import httpx
+import hashlib
 import os
 import math
 import logging
@@ -256,9 +257,18 @@ def get_gig_reviews(
 
 # Get Review Statistics for Gig
 @router.get("/gig/{gig_id}/stats", response_model=ReviewStats)
-def get_gig_review_stats(gig_id: str, db: Session = Depends(get_db)):
-    """Get review statistics for a specific gig"""
-    return review_crud.get_review_stats_for_gig(db, gig_id)
+def get_gig_review_stats(gig_id: str, request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Get review statistics for a specific gig.
+    Responses carry an ETag of the stats; a request whose If-None-Match matches it gets an
+    empty 304 Not Modified, so callers holding the same stats skip the body.
+    """
+    stats = review_crud.get_review_stats_for_gig(db, gig_id)
+    etag = f'"{hashlib.sha1(stats.model_dump_json().encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return stats
 
 @router.get("/gig/{gig_id}/average-rating", response_model=dict)
 def get_gig_average_rating(gig_id: str, db: Session = Depends(get_db)):